@@ -1,8 +1,6 @@
 import streamlit as st
 from datetime import datetime
 from openai import OpenAI
-import requests
-import json
 import uuid
 
 
@@ -32,14 +30,19 @@ except KeyError:
     st.error("OPENROUTER_API_KEY not found")
     st.stop()
 
-client = OpenAI(
-    base_url="https://openrouter.ai/api/v1",
-    api_key=api_key,
-    default_headers={
-        "HTTP-Referer": "http://localhost:8501",
-        "X-Title": "My ChatBot",
-    }
-)
+# Cached so the client's connection pool survives reruns
+@st.cache_resource
+def get_client(api_key):
+    return OpenAI(
+        base_url="https://openrouter.ai/api/v1",
+        api_key=api_key,
+        default_headers={
+            "HTTP-Referer": "http://localhost:8501",
+            "X-Title": "My ChatBot",
+        }
+    )
+
+client = get_client(api_key)
 
 # -----------------------------
 # Helpers
@@ -65,6 +68,8 @@ def create_new_chat():
         }],
         "created_at": datetime.now()
     }
+    # Newest first; kept in sync here so the sidebar never has to sort
+    st.session_state.chat_order.insert(0, chat_id)
     st.session_state.active_chat_id = chat_id
 
 RESPONSE_STYLE_PROMPTS = {
@@ -84,9 +89,19 @@ RESPONSE_STYLE_PROMPTS = {
     "Persuasive": "Respond with the goal of convincing the reader using logical arguments.",
     "Action-Oriented": "Focus on concrete next steps and actionable advice."
 }
+RESPONSE_STYLES = tuple(RESPONSE_STYLE_PROMPTS)
 # -----------------------------
 # Session state init
 # -----------------------------
+if "chat_order" not in st.session_state:
+    # Seed from chats left over from before chat_order existed (e.g. a
+    # hot-reload), newest first, so the sidebar does not come up empty
+    st.session_state.chat_order = sorted(
+        st.session_state.get("chats", {}),
+        key=lambda cid: st.session_state.chats[cid]["created_at"],
+        reverse=True,
+    )
+
 if "chats" not in st.session_state:
     st.session_state.chats = {}
     create_new_chat()
@@ -110,11 +125,8 @@ with st.sidebar:
 
     st.markdown("### Chat History")
 
-    for chat_id, chat in sorted(
-        st.session_state.chats.items(),
-        key=lambda x: x[1]["created_at"],
-        reverse=True
-    ):
+    for chat_id in list(st.session_state.chat_order):
+        chat = st.session_state.chats[chat_id]
         col1, col2 = st.columns([5, 1])
 
         with col1:
@@ -129,6 +141,7 @@ with st.sidebar:
         with col2:
             if st.button("🗑️", key=f"delete_{chat_id}"):
                 del st.session_state.chats[chat_id]
+                st.session_state.chat_order.remove(chat_id)
                 if chat_id == st.session_state.active_chat_id:
                     create_new_chat()
                 st.rerun()
@@ -145,7 +158,7 @@ with st.sidebar:
 
     response_style = st.selectbox(
         "Response Style:",
-         list(RESPONSE_STYLE_PROMPTS.keys()),  # dynamically pulls all style names,
+         RESPONSE_STYLES,  # dynamically pulls all style names,
         index=0,
     )
 
@@ -203,42 +216,42 @@ for msg in messages[-max_history:]:
 # -----------------------------
 # OpenRouter API Call
 # -----------------------------
-def get_ai_response(messages):
-    url = "https://openrouter.ai/api/v1/chat/completions"
-
-    style_prompt = RESPONSE_STYLE_PROMPTS.get(
-        response_style,
-        "Respond helpfully and clearly."
-    )
+style_prompt = RESPONSE_STYLE_PROMPTS.get(
+    response_style,
+    "Respond helpfully and clearly."
+)
+system_message = {
+    "role": "system",
+    "content": f"You are a helpful assistant. {style_prompt}"
+}
 
-    clean_messages = [
-        {
-            "role": "system",
-            "content": f"You are a helpful assistant. {style_prompt}"
-        }
-    ] + [
+def get_ai_response(messages, placeholder):
+    # Only the last max_history messages are sent, matching what is displayed
+    clean_messages = [system_message] + [
         {"role": m["role"], "content": m["content"]}
-        for m in messages
+        for m in messages[-max_history:]
     ]
 
-
-    payload = {
-        "model": MODEL_NAME,
-        "messages": clean_messages
-    }
-
-    headers = {
-        "Authorization": f"Bearer {api_key}",
-        "Content-Type": "application/json"
-    }
-
     print(messages)
-    response = requests.post(url, headers=headers, json=payload)
-    
-    if response.status_code != 200:
-        return f"Error: {response.text}"
-
-    return response.json()["choices"][0]["message"]["content"]
+    # Stream tokens into the placeholder as they arrive
+    reply = ""
+    try:
+        stream = client.chat.completions.create(
+            model=MODEL_NAME,
+            messages=clean_messages,
+            stream=True,
+        )
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            reply += chunk.choices[0].delta.content or ""
+            placeholder.markdown(reply)
+    except Exception as e:
+        # Keep any partial reply and show the error in place of the stream
+        reply = f"{reply}\n\nError: {e}" if reply else f"Error: {e}"
+        placeholder.markdown(reply)
+
+    return reply
 
 # -----------------------------
 # Chat input
@@ -246,13 +259,20 @@ def get_ai_response(messages):
 user_input = st.chat_input(f"Message {assistant_name}...")
 
 if user_input:
+    user_ts = now_ts()
     messages.append({
         "role": "user",
         "content": user_input,
-        "timestamp": now_ts()
+        "timestamp": user_ts
     })
 
-    assistant_reply = get_ai_response(messages)
+    with st.chat_message("user"):
+        if show_timestamps:
+            st.caption(user_ts)
+        st.write(user_input)
+
+    with st.chat_message("assistant"):
+        assistant_reply = get_ai_response(messages, st.empty())
 
     messages.append({
         "role": "assistant",
@@ -261,9 +281,11 @@ if user_input:
         "timestamp": now_ts()
     })
 
-    current_chat["title"] = generate_chat_title(messages)
-
-    st.rerun()
+    # Only rerun when the sidebar title actually needs to change
+    new_title = generate_chat_title(messages)
+    if new_title != current_chat["title"]:
+        current_chat["title"] = new_title
+        st.rerun()
 
 # -----------------------------
 # Expandable sections
@@ -12,6 +12,7 @@ Each agent has a single responsibility:
     report_agent.py       — Compiles structured report, evaluates quality.
 
 Each agent exposes:
-    - A result dataclass (e.g., SourceDocument, AnalysisResult)
+    - A result schema: a dataclass (e.g., AnalysisResult), or a TypedDict
+      where the records travel through state as dicts (SourceDocument)
     - An Agent class with a run(state) method
 """
@@ -13,20 +13,67 @@ INPUT (from state):
 
 OUTPUT (to state):
     analysis: dict — AnalysisResult with findings, contradictions, gaps.
+
+CONCURRENCY:
+    Large source sets are split into shards of settings.ANALYSIS_SHARD_SIZE
+    and analyzed by concurrent LLM calls; the shard results are merged
+    before fact-checking. Source indices stay global across shards.
+
+SOURCE CAP:
+    Reflection loops keep appending sources. Only the top
+    settings.MAX_SOURCES_FOR_ANALYSIS (by source-type authority, then
+    relevance) are analyzed, so per-iteration cost stays bounded. Selected
+    sources keep their original indices.
 """
 
 from __future__ import annotations
 
+import asyncio
+import heapq
 import logging
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from utils.llm_client import LLMClient
+from utils.prompt_template import compile_template
 from prompts.analysis_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from config import settings
 
 logger = logging.getLogger(__name__)
 
-
-@dataclass
+_render_user_prompt = compile_template(USER_PROMPT_TEMPLATE)
+
+# Read-only skeleton for the no-sources / error paths. Fallbacks copy it
+# and override only the fields they set; tuples stand in for empty lists.
+_EMPTY_ANALYSIS = MappingProxyType({
+    "executive_summary": "",
+    "findings": (),
+    "contradictions": (),
+    "gaps": (),
+    "source_assessments": (),
+})
+
+# Ranking used when the source list exceeds MAX_SOURCES_FOR_ANALYSIS.
+# Unlisted types (e.g. "other") rank between news and blogs.
+SOURCE_TYPE_PRIORITY: dict[str, int] = {
+    "academic": 4,
+    "government": 4,
+    "news": 3,
+    "encyclopedia": 3,
+    "blog": 1,
+}
+
+
+def _source_priority(item: tuple[int, dict]) -> tuple[int, float]:
+    """Sort key for an (index, source) pair: authority, then relevance."""
+    src = item[1]
+    return (
+        SOURCE_TYPE_PRIORITY.get(src.get("source_type", "other"), 2),
+        src.get("relevance_score") or 0.0,
+    )
+
+
+@dataclass(slots=True)
 class Finding:
     """A single research finding extracted from sources."""
     claim: str
@@ -35,7 +82,7 @@ class Finding:
     importance: str = "medium"    # high, medium, low
 
 
-@dataclass
+@dataclass(slots=True)
 class AnalysisResult:
     """Complete analysis output."""
     executive_summary: str = ""
@@ -61,6 +108,18 @@ class AnalysisAgent:
         self.llm = llm or LLMClient()
 
     def run(self, state: dict) -> dict:
+        """
+        Synchronous entry point: analyze the collected sources.
+
+        Args:
+            state: Current ResearchState dict.
+
+        Returns:
+            State update with analysis dict.
+        """
+        return asyncio.run(self.arun(state))
+
+    async def arun(self, state: dict) -> dict:
         """
         LangGraph node function: analyze the collected sources.
 
@@ -77,33 +136,40 @@ class AnalysisAgent:
             logger.warning("No sources to analyze")
             return {
                 "analysis": {
+                    **_EMPTY_ANALYSIS,
                     "executive_summary": "No sources were found for this query.",
-                    "findings": [],
-                    "contradictions": [],
                     "gaps": ["No sources were retrieved"],
-                    "source_assessments": [],
                 },
                 "status": "Analysis: No sources available",
             }
 
-        # Format sources for the LLM
-        sources_text = self._format_sources(sources)
+        # Keep original indices so findings still cite state["sources"]
+        indexed = list(enumerate(sources))
+        cap = settings.MAX_SOURCES_FOR_ANALYSIS
+        if 0 < cap < len(indexed):
+            # Restore source order so unchanged shards keep hitting the LLM cache
+            indexed = sorted(heapq.nlargest(cap, indexed, key=_source_priority))
+            logger.info(f"Analyzing top {cap} of {len(sources)} sources")
 
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            query=query,
-            sources_text=sources_text,
-        )
+        shard_size = max(1, settings.ANALYSIS_SHARD_SIZE)
+        shards = [
+            indexed[start:start + shard_size]
+            for start in range(0, len(indexed), shard_size)
+        ]
 
         try:
-            result = self.llm.chat_json(SYSTEM_PROMPT, user_prompt)
-
-            analysis = {
-                "executive_summary": result.get("executive_summary", ""),
-                "findings": result.get("findings", []),
-                "contradictions": result.get("contradictions", []),
-                "gaps": result.get("gaps", []),
-                "source_assessments": result.get("source_assessments", []),
-            }
+            results = await asyncio.gather(
+                *(self._analyze_shard(query, shard) for shard in shards),
+                return_exceptions=True,
+            )
+            succeeded = [r for r in results if not isinstance(r, BaseException)]
+            failed = [r for r in results if isinstance(r, BaseException)]
+            if not succeeded:
+                raise failed[0]
+            for err in failed:
+                logger.warning(f"Analysis shard failed, continuing with the rest: {err}")
+
+            analysis = self._merge_results(succeeded)
 
             n_findings = len(analysis["findings"])
             n_contradictions = len(analysis["contradictions"])
@@ -111,7 +177,8 @@ class AnalysisAgent:
 
             logger.info(
                 f"Analysis complete: {n_findings} findings, "
-                f"{n_contradictions} contradictions, {n_gaps} gaps"
+                f"{n_contradictions} contradictions, {n_gaps} gaps "
+                f"({len(succeeded)}/{len(shards)} shards)"
             )
 
             return {
@@ -123,27 +190,62 @@ class AnalysisAgent:
             logger.error(f"Analysis failed: {e}")
             return {
                 "analysis": {
+                    **_EMPTY_ANALYSIS,
                     "executive_summary": f"Analysis encountered an error: {str(e)}",
-                    "findings": [],
-                    "contradictions": [],
                     "gaps": ["Analysis failed — manual review recommended"],
-                    "source_assessments": [],
                 },
                 "status": f"Analysis error: {str(e)[:100]}",
-                "errors": state.get("errors", []) + [f"Analysis: {str(e)}"],
+                "errors": [f"Analysis: {str(e)}"],
             }
 
+    async def _analyze_shard(self, query: str, shard: list[tuple[int, dict]]) -> dict:
+        """Run one analysis LLM call over a shard of (index, source) pairs."""
+        user_prompt = _render_user_prompt(
+            query=query,
+            sources_text=self._format_sources(shard),
+        )
+        # Opt in to memoization: an unchanged shard in the reflection loop
+        # reuses its analysis instead of being re-sent
+        return await self.llm.achat_json(SYSTEM_PROMPT, user_prompt, cache=True)
+
     @staticmethod
-    def _format_sources(sources: list[dict]) -> str:
-        """Format sources for the LLM prompt."""
-        parts = []
-        for i, src in enumerate(sources):
-            parts.append(
-                f"[Source {i}]\n"
-                f"  Title: {src.get('title', 'Unknown')}\n"
-                f"  URL: {src.get('url', 'N/A')}\n"
-                f"  Type: {src.get('source_type', 'unknown')}\n"
-                f"  Domain: {src.get('domain', 'unknown')}\n"
-                f"  Content:\n{src.get('content', '')[:1500]}\n"
-            )
-        return "\n---\n".join(parts)
+    def _merge_results(results: list[dict]) -> dict:
+        """Combine per-shard LLM outputs into a single analysis dict."""
+        analysis = {
+            "executive_summary": "\n\n".join(
+                r["executive_summary"] for r in results if r.get("executive_summary")
+            ),
+            "findings": [],
+            "contradictions": [],
+            "gaps": [],
+            "source_assessments": [],
+        }
+        for r in results:
+            analysis["findings"].extend(r.get("findings", []))
+            analysis["contradictions"].extend(r.get("contradictions", []))
+            analysis["gaps"].extend(r.get("gaps", []))
+            analysis["source_assessments"].extend(r.get("source_assessments", []))
+        return analysis
+
+    @staticmethod
+    def _format_sources(indexed_sources: list[tuple[int, dict]]) -> str:
+        """Format (index, source) pairs for the LLM prompt under their global index."""
+        # Fragments go into one flat list and are joined once, so no
+        # per-source intermediate string is built.
+        parts: list[str] = []
+        push = parts.extend
+        for i, src in indexed_sources:
+            get = src.get
+            content = get("content", "")[:settings.SOURCE_CONTENT_CHARS]
+            push((
+                "[Source ", str(i), "]\n",
+                "  Title: ", str(get("title", "Unknown")), "\n",
+                "  URL: ", str(get("url", "N/A")), "\n",
+                "  Type: ", str(get("source_type", "unknown")), "\n",
+                "  Domain: ", str(get("domain", "unknown")), "\n",
+                "  Content:\n", content, "\n",
+                "\n---\n",
+            ))
+        if parts:
+            parts.pop()  # no separator after the last source
+        return "".join(parts)
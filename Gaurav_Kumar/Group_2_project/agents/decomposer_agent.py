@@ -27,17 +27,21 @@ EXAMPLE:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass
 
 from utils.llm_client import LLMClient
+from utils.prompt_template import compile_template
 from prompts.decomposer_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+_render_user_prompt = compile_template(USER_PROMPT_TEMPLATE)
 
-@dataclass
+
+@dataclass(slots=True)
 class DecompositionResult:
     """Result of query decomposition."""
     original_query: str
@@ -58,6 +62,18 @@ class DecomposerAgent:
         self.llm = llm or LLMClient()
 
     def run(self, state: dict) -> dict:
+        """
+        Synchronous entry point: decompose the research query.
+
+        Args:
+            state: Current ResearchState dict.
+
+        Returns:
+            State update (see arun).
+        """
+        return asyncio.run(self.arun(state))
+
+    async def arun(self, state: dict) -> dict:
         """
         LangGraph node function: decompose the research query.
 
@@ -84,13 +100,13 @@ class DecomposerAgent:
 
         context = previous_gaps or "This is the first research pass."
 
-        user_prompt = USER_PROMPT_TEMPLATE.format(
+        user_prompt = _render_user_prompt(
             query=query,
             context=context,
         )
 
         try:
-            result = self.llm.chat_json(SYSTEM_PROMPT, user_prompt)
+            result = await self.llm.achat_json(SYSTEM_PROMPT, user_prompt)
             sub_queries = result.get("sub_queries", [query])
 
             # Enforce limits
@@ -112,5 +128,5 @@ class DecomposerAgent:
             return {
                 "sub_queries": [query],
                 "status": f"Decomposition fallback: {str(e)[:100]}",
-                "errors": state.get("errors", []) + [f"Decomposer: {str(e)}"],
+                "errors": [f"Decomposer: {str(e)}"],
             }
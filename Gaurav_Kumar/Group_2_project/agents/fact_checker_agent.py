@@ -14,20 +14,53 @@ INPUT (from state):
 
 OUTPUT (to state):
     fact_check: dict — FactCheckResult with verified claims and scores.
+
+BATCHING:
+    Findings are checked in batches of settings.FACTCHECK_BATCH_SIZE, sent
+    concurrently so long finding lists never overflow the model's context.
+    Batch results are merged and the reliability score is averaged,
+    weighted by batch size.
+
+RULE-BASED SHORTCUT:
+    When settings.FACTCHECK_RULE_VERIFY is on, a factual finding that is
+    backed by several distinct academic/government domains, and that shares
+    no source with a reported contradiction, is verified without an LLM
+    call. Only the remaining, ambiguous findings are sent to the model.
 """
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from utils.llm_client import LLMClient
+from utils.prompt_template import compile_template
 from prompts.fact_checker_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
+from config import settings
 
 logger = logging.getLogger(__name__)
 
+_render_user_prompt = compile_template(USER_PROMPT_TEMPLATE)
+
+# Read-only skeleton for the early-return / error paths; see analysis_agent.
+_EMPTY_FACTCHECK = MappingProxyType({
+    "verified_claims": (),
+    "overall_reliability_score": 0,
+    "warnings": (),
+    "contradiction_details": (),
+})
+
+# Rule-based verification: which source types count as authoritative, how
+# many distinct such domains a claim needs, and the confidence assigned.
+AUTHORITATIVE_SOURCE_TYPES = frozenset({"academic", "government"})
+RULE_MIN_AUTHORITATIVE_DOMAINS = 2
+RULE_CONFIDENCE = 85
+
 
-@dataclass
+@dataclass(slots=True)
 class VerifiedClaim:
     """A fact-checked research claim with confidence score."""
     claim: str
@@ -38,7 +71,7 @@ class VerifiedClaim:
     reasoning: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class FactCheckResult:
     """Complete fact-check output."""
     verified_claims: list[dict] = field(default_factory=list)
@@ -62,6 +95,18 @@ class FactCheckerAgent:
         self.llm = llm or LLMClient()
 
     def run(self, state: dict) -> dict:
+        """
+        Synchronous entry point: fact-check analysis findings.
+
+        Args:
+            state: Current ResearchState dict.
+
+        Returns:
+            State update (see arun).
+        """
+        return asyncio.run(self.arun(state))
+
+    async def arun(self, state: dict) -> dict:
         """
         LangGraph node function: fact-check analysis findings.
 
@@ -80,48 +125,79 @@ class FactCheckerAgent:
             logger.warning("No findings to fact-check")
             return {
                 "fact_check": {
-                    "verified_claims": [],
-                    "overall_reliability_score": 0,
+                    **_EMPTY_FACTCHECK,
                     "warnings": ["No findings available for fact-checking"],
-                    "contradiction_details": [],
                 },
                 "status": "Fact-check: No findings to verify",
             }
 
-        # Format inputs for the LLM
-        findings_text = self._format_findings(findings)
+        # Settle the easy findings by rule; only the rest need the LLM
+        rule_claims: list[dict] = []
+        if settings.FACTCHECK_RULE_VERIFY:
+            contested = self._contested_sources(analysis.get("contradictions", []))
+            residual = []
+            for f in findings:
+                claim = self._rule_classify(f, sources, contested)
+                if claim is None:
+                    residual.append(f)
+                else:
+                    rule_claims.append(claim)
+            findings = residual
+            if rule_claims:
+                logger.info(
+                    f"Rule-verified {len(rule_claims)} finding(s); "
+                    f"{len(findings)} left for the LLM"
+                )
+
+        if not findings:
+            return {
+                "fact_check": {
+                    **_EMPTY_FACTCHECK,
+                    "verified_claims": rule_claims,
+                    "overall_reliability_score": RULE_CONFIDENCE,
+                },
+                "status": f"Fact-checked: {len(rule_claims)} verified by source agreement (reliability: {RULE_CONFIDENCE}%)",
+            }
+
+        # Sources are shared context for every batch, so format them once
         sources_text = self._format_sources_brief(sources)
 
-        user_prompt = USER_PROMPT_TEMPLATE.format(
-            query=query,
-            findings_text=findings_text,
-            sources_text=sources_text,
-        )
+        batch_size = max(1, settings.FACTCHECK_BATCH_SIZE)
+        batches = [
+            (start, findings[start:start + batch_size])
+            for start in range(0, len(findings), batch_size)
+        ]
 
         try:
-            result = self.llm.chat_json(SYSTEM_PROMPT, user_prompt)
+            results = await asyncio.gather(
+                *(
+                    self._check_batch(query, start, batch, sources_text)
+                    for start, batch in batches
+                ),
+                return_exceptions=True,
+            )
+            if all(isinstance(r, BaseException) for r in results):
+                raise results[0]
 
-            fact_check = {
-                "verified_claims": result.get("verified_claims", []),
-                "overall_reliability_score": result.get("overall_reliability_score", 50),
-                "warnings": result.get("warnings", []),
-                "contradiction_details": result.get("contradiction_details", []),
-            }
+            fact_check = self._merge_results(batches, results)
+            if rule_claims:
+                n_checked = len(findings)
+                fact_check["overall_reliability_score"] = round(
+                    (float(fact_check["overall_reliability_score"]) * n_checked
+                     + RULE_CONFIDENCE * len(rule_claims))
+                    / (n_checked + len(rule_claims)),
+                    1,
+                )
+                fact_check["verified_claims"] = rule_claims + fact_check["verified_claims"]
 
-            # Count by status
-            verified = sum(
-                1 for c in fact_check["verified_claims"]
-                if c.get("status") == "verified"
-            )
-            disputed = sum(
-                1 for c in fact_check["verified_claims"]
-                if c.get("status") == "disputed"
-            )
+            # Count by status in a single pass
+            statuses = Counter(c.get("status") for c in fact_check["verified_claims"])
+            verified, disputed = statuses["verified"], statuses["disputed"]
             reliability = fact_check["overall_reliability_score"]
 
             logger.info(
                 f"Fact-check complete: {verified} verified, {disputed} disputed, "
-                f"reliability: {reliability}/100"
+                f"reliability: {reliability}/100 ({len(batches)} batch(es))"
             )
 
             return {
@@ -134,50 +210,183 @@ class FactCheckerAgent:
             # Graceful degradation: pass through findings as unverified
             return {
                 "fact_check": {
-                    "verified_claims": [
-                        {
-                            "claim": f.get("claim", ""),
-                            "confidence_score": 50,
-                            "status": "unverified",
-                            "supporting_sources": f.get("source_indices", []),
-                            "contradicting_sources": [],
-                            "reasoning": "Fact-check unavailable — treating as unverified",
-                        }
-                        for f in findings
-                    ],
+                    **_EMPTY_FACTCHECK,
+                    "verified_claims": rule_claims + self._unverified_claims(findings),
                     "overall_reliability_score": 40,
                     "warnings": [
                         f"Fact-checking failed ({str(e)[:80]}). "
                         "All claims marked as unverified."
                     ],
-                    "contradiction_details": [],
                 },
                 "status": f"Fact-check fallback: {str(e)[:100]}",
-                "errors": state.get("errors", []) + [f"FactChecker: {str(e)}"],
+                "errors": [f"FactChecker: {str(e)}"],
+            }
+
+    async def _check_batch(
+        self, query: str, offset: int, findings: list[dict], sources_text: str,
+    ) -> dict:
+        """Fact-check one batch of findings with a single LLM call."""
+        user_prompt = _render_user_prompt(
+            query=query,
+            findings_text=self._format_findings(findings, offset),
+            sources_text=sources_text,
+        )
+        # Opt in to memoization: a batch whose query, findings and sources
+        # are unchanged reuses its verdicts instead of being re-sent
+        return await self.llm.achat_json(SYSTEM_PROMPT, user_prompt, cache=True)
+
+    @classmethod
+    def _merge_results(cls, batches: list[tuple[int, list[dict]]], results: list) -> dict:
+        """
+        Merge per-batch LLM outputs into one fact-check dict.
+
+        Batches whose call failed contribute their findings as unverified
+        claims (scored 40, like the full fallback) plus a warning.
+        """
+        if len(results) == 1:
+            result = results[0]
+            return {
+                "verified_claims": result.get("verified_claims", []),
+                "overall_reliability_score": result.get("overall_reliability_score", 50),
+                "warnings": result.get("warnings", []),
+                "contradiction_details": result.get("contradiction_details", []),
             }
 
+        fact_check = {
+            "verified_claims": [],
+            "overall_reliability_score": 0,
+            "warnings": [],
+            "contradiction_details": [],
+        }
+        weighted_total = 0.0
+        for (start, batch), result in zip(batches, results):
+            if isinstance(result, BaseException):
+                logger.warning(f"Fact-check batch at finding {start} failed: {result}")
+                fact_check["verified_claims"].extend(cls._unverified_claims(batch))
+                fact_check["warnings"].append(
+                    f"Fact-checking failed for findings {start}-{start + len(batch) - 1} "
+                    f"({str(result)[:80]}). Those claims are marked as unverified."
+                )
+                weighted_total += 40 * len(batch)
+                continue
+            fact_check["verified_claims"].extend(result.get("verified_claims", []))
+            fact_check["warnings"].extend(result.get("warnings", []))
+            fact_check["contradiction_details"].extend(result.get("contradiction_details", []))
+            try:
+                score = float(result.get("overall_reliability_score", 50))
+            except (TypeError, ValueError):
+                score = 50.0
+            weighted_total += score * len(batch)
+
+        n_findings = sum(len(batch) for _, batch in batches)
+        fact_check["overall_reliability_score"] = round(weighted_total / n_findings, 1)
+        return fact_check
+
     @staticmethod
-    def _format_findings(findings: list[dict]) -> str:
-        """Format findings for fact-check prompt."""
-        parts = []
-        for i, f in enumerate(findings):
-            parts.append(
-                f"[Finding {i}]\n"
-                f"  Claim: {f.get('claim', '')}\n"
-                f"  Category: {f.get('category', 'unknown')}\n"
-                f"  Source indices: {f.get('source_indices', [])}\n"
-                f"  Importance: {f.get('importance', 'medium')}"
-            )
-        return "\n\n".join(parts)
+    def _contested_sources(contradictions: list[dict]) -> set:
+        """Indices of every source on either side of a reported contradiction."""
+        contested: set = set()
+        for c in contradictions:
+            contested.update(c.get("source_indices_a", []))
+            contested.update(c.get("source_indices_b", []))
+        return contested
+
+    @staticmethod
+    def _rule_classify(finding: dict, sources: list[dict], contested: set) -> dict | None:
+        """
+        Verify a finding without the LLM when the evidence is unambiguous.
+
+        A finding qualifies when it is a fact or statistic, none of its
+        sources appear in a reported contradiction, and its sources span at
+        least RULE_MIN_AUTHORITATIVE_DOMAINS distinct authoritative domains.
+
+        Args:
+            finding: A finding dict from the analysis agent.
+            sources: The full source list the indices refer to.
+            contested: Source indices involved in any contradiction.
+
+        Returns:
+            A verified-claim dict, or None if the LLM should decide.
+        """
+        if finding.get("category") not in ("fact", "statistic"):
+            return None
+        indices = [
+            i for i in finding.get("source_indices", [])
+            if isinstance(i, int) and 0 <= i < len(sources)
+        ]
+        if not indices or contested.intersection(indices):
+            return None
+
+        domains = {
+            sources[i].get("domain")
+            for i in indices
+            if sources[i].get("source_type") in AUTHORITATIVE_SOURCE_TYPES
+        }
+        domains.discard(None)
+        domains.discard("")
+        if len(domains) < RULE_MIN_AUTHORITATIVE_DOMAINS:
+            return None
+
+        return {
+            "claim": finding.get("claim", ""),
+            "confidence_score": RULE_CONFIDENCE,
+            "status": "verified",
+            "supporting_sources": indices,
+            "contradicting_sources": [],
+            "reasoning": (
+                f"Corroborated by {len(domains)} independent authoritative "
+                "sources with no reported contradiction (rule-based check)"
+            ),
+        }
+
+    @staticmethod
+    def _unverified_claims(findings: list[dict]) -> list[dict]:
+        """Pass findings through as unverified claims (fallback path)."""
+        return [
+            {
+                "claim": f.get("claim", ""),
+                "confidence_score": 50,
+                "status": "unverified",
+                "supporting_sources": f.get("source_indices", []),
+                "contradicting_sources": [],
+                "reasoning": "Fact-check unavailable — treating as unverified",
+            }
+            for f in findings
+        ]
+
+    @staticmethod
+    def _format_findings(findings: list[dict], offset: int = 0) -> str:
+        """Format findings for fact-check prompt, numbering from `offset`."""
+        parts: list[str] = []
+        push = parts.extend
+        for i, f in enumerate(findings, start=offset):
+            get = f.get
+            push((
+                "[Finding ", str(i), "]\n",
+                "  Claim: ", str(get("claim", "")), "\n",
+                "  Category: ", str(get("category", "unknown")), "\n",
+                "  Source indices: ", str(get("source_indices", [])), "\n",
+                "  Importance: ", str(get("importance", "medium")),
+                "\n\n",
+            ))
+        if parts:
+            parts.pop()
+        return "".join(parts)
 
     @staticmethod
     def _format_sources_brief(sources: list[dict]) -> str:
         """Format sources briefly for cross-reference context."""
-        parts = []
+        parts: list[str] = []
+        push = parts.extend
         for i, src in enumerate(sources):
-            parts.append(
-                f"[{i}] {src.get('title', 'Unknown')} "
-                f"({src.get('source_type', 'unknown')}, {src.get('domain', 'unknown')}) — "
-                f"{src.get('content', '')[:300]}..."
-            )
-        return "\n".join(parts)
+            get = src.get
+            snippet = get("content", "")[:300]
+            push((
+                "[", str(i), "] ", str(get("title", "Unknown")),
+                " (", str(get("source_type", "unknown")), ", ", str(get("domain", "unknown")), ") — ",
+                snippet, "...",
+                "\n",
+            ))
+        if parts:
+            parts.pop()
+        return "".join(parts)
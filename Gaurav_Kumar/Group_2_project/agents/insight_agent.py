@@ -18,16 +18,34 @@ OUTPUT (to state):
 
 from __future__ import annotations
 
+import asyncio
 import logging
+from collections import Counter
 from dataclasses import dataclass, field
+from types import MappingProxyType
 
 from utils.llm_client import LLMClient
+from utils.prompt_template import compile_template
 from prompts.insight_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+_render_user_prompt = compile_template(USER_PROMPT_TEMPLATE)
 
-@dataclass
+# Read-only skeleton for the error path; see analysis_agent.
+_EMPTY_INSIGHTS = MappingProxyType({
+    "hypotheses": (),
+    "trends": (),
+    "key_patterns": (),
+    "implications": (),
+    "further_questions": (
+        "What are the main factors driving this topic?",
+        "What are experts predicting for the near future?",
+    ),
+})
+
+
+@dataclass(slots=True)
 class Hypothesis:
     """A research hypothesis with supporting evidence."""
     statement: str
@@ -36,7 +54,7 @@ class Hypothesis:
     reasoning_chain: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class Trend:
     """An identified trend or pattern."""
     description: str
@@ -45,7 +63,7 @@ class Trend:
     timeframe: str = "medium-term"
 
 
-@dataclass
+@dataclass(slots=True)
 class InsightResult:
     """Complete insight generation output."""
     hypotheses: list[dict] = field(default_factory=list)
@@ -70,6 +88,18 @@ class InsightAgent:
         self.llm = llm or LLMClient()
 
     def run(self, state: dict) -> dict:
+        """
+        Synchronous entry point: generate insights from findings.
+
+        Args:
+            state: Current ResearchState dict.
+
+        Returns:
+            State update (see arun).
+        """
+        return asyncio.run(self.arun(state))
+
+    async def arun(self, state: dict) -> dict:
         """
         LangGraph node function: generate insights from findings.
 
@@ -92,7 +122,7 @@ class InsightAgent:
         fact_check_text = self._format_fact_check_summary(fact_check)
         gaps_text = "\n".join(f"- {g}" for g in gaps) if gaps else "No significant gaps identified."
 
-        user_prompt = USER_PROMPT_TEMPLATE.format(
+        user_prompt = _render_user_prompt(
             query=query,
             findings_text=findings_text,
             fact_check_text=fact_check_text,
@@ -100,7 +130,7 @@ class InsightAgent:
         )
 
         try:
-            result = self.llm.chat_json(SYSTEM_PROMPT, user_prompt)
+            result = await self.llm.achat_json(SYSTEM_PROMPT, user_prompt)
 
             insights = {
                 "hypotheses": result.get("hypotheses", []),
@@ -128,58 +158,50 @@ class InsightAgent:
             logger.error(f"Insight generation failed: {e}")
             return {
                 "insights": {
-                    "hypotheses": [],
-                    "trends": [],
-                    "key_patterns": [],
+                    **_EMPTY_INSIGHTS,
                     "implications": [f"Insight generation encountered an error: {str(e)}"],
-                    "further_questions": [
-                        "What are the main factors driving this topic?",
-                        "What are experts predicting for the near future?",
-                    ],
                 },
                 "status": f"Insight error: {str(e)[:100]}",
-                "errors": state.get("errors", []) + [f"Insights: {str(e)}"],
+                "errors": [f"Insights: {str(e)}"],
             }
 
     @staticmethod
     def _format_verified_findings(findings: list[dict], verified: list[dict]) -> str:
         """Merge findings with their verification status."""
-        # Build a lookup from claim text to verification info
-        verification_map = {}
-        for vc in verified:
-            claim_key = vc.get("claim", "")[:80]
-            verification_map[claim_key] = vc
-
-        parts = []
+        # Look up by the full whitespace-normalized claim so distinct claims
+        # sharing an opening never collide; fall back to the 80-char prefix
+        # for claims the fact-checker echoed back truncated.
+        verification_map = {" ".join(vc.get("claim", "").split()): vc for vc in verified}
+        prefix_map = {key[:80]: vc for key, vc in verification_map.items()}
+
+        parts: list[str] = []
+        push = parts.extend
         for i, f in enumerate(findings):
             claim = f.get("claim", "")
-            claim_key = claim[:80]
-            vc = verification_map.get(claim_key, {})
-            confidence = vc.get("confidence_score", "N/A")
-            status = vc.get("status", "unverified")
-
-            parts.append(
-                f"[{i}] {claim}\n"
-                f"    Category: {f.get('category', 'unknown')} | "
-                f"Confidence: {confidence}% | Status: {status}"
-            )
-
-        return "\n\n".join(parts) if parts else "No findings available."
+            key = " ".join(str(claim).split())
+            vc = verification_map.get(key) or prefix_map.get(key[:80], {})
+            push((
+                "[", str(i), "] ", str(claim), "\n",
+                "    Category: ", str(f.get("category", "unknown")),
+                " | Confidence: ", str(vc.get("confidence_score", "N/A")),
+                "% | Status: ", str(vc.get("status", "unverified")),
+                "\n\n",
+            ))
+
+        if not parts:
+            return "No findings available."
+        parts.pop()
+        return "".join(parts)
 
     @staticmethod
     def _format_fact_check_summary(fact_check: dict) -> str:
         """Format fact-check results as a brief summary."""
         reliability = fact_check.get("overall_reliability_score", "N/A")
         warnings = fact_check.get("warnings", [])
-        n_verified = sum(
-            1 for c in fact_check.get("verified_claims", [])
-            if c.get("status") == "verified"
-        )
-        n_disputed = sum(
-            1 for c in fact_check.get("verified_claims", [])
-            if c.get("status") == "disputed"
-        )
-        total = len(fact_check.get("verified_claims", []))
+        # One pass over the claims tallies every status at once
+        statuses = Counter(c.get("status") for c in fact_check.get("verified_claims", ()))
+        n_verified, n_disputed = statuses["verified"], statuses["disputed"]
+        total = statuses.total()
 
         summary = (
             f"Overall reliability: {reliability}/100\n"
@@ -18,17 +18,22 @@ OUTPUT (to state):
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import islice
 
 from utils.llm_client import LLMClient
+from utils.prompt_template import compile_template
 from prompts.report_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 
 logger = logging.getLogger(__name__)
 
+_render_user_prompt = compile_template(USER_PROMPT_TEMPLATE)
 
-@dataclass
+
+@dataclass(slots=True)
 class ReportResult:
     """Complete research report output."""
     title: str = ""
@@ -63,6 +68,18 @@ class ReportAgent:
         self.llm = llm or LLMClient()
 
     def run(self, state: dict) -> dict:
+        """
+        Synchronous entry point: build the final report.
+
+        Args:
+            state: Current ResearchState dict.
+
+        Returns:
+            State update (see arun).
+        """
+        return asyncio.run(self.arun(state))
+
+    async def arun(self, state: dict) -> dict:
         """
         LangGraph node function: build the final report.
 
@@ -96,7 +113,7 @@ class ReportAgent:
 
         sources_summary = self._format_sources_summary(sources)
 
-        user_prompt = USER_PROMPT_TEMPLATE.format(
+        user_prompt = _render_user_prompt(
             query=query,
             analysis_summary=analysis_summary,
             verified_findings_text=verified_findings_text,
@@ -107,7 +124,9 @@ class ReportAgent:
         )
 
         try:
-            result = self.llm.chat_json(SYSTEM_PROMPT, user_prompt)
+            # A reflection pass that changed nothing upstream renders the
+            # identical prompt and is answered from the LLM client's cache.
+            result = await self.llm.achat_json(SYSTEM_PROMPT, user_prompt, cache=True)
 
             quality_score = float(result.get("quality_score", 50))
 
@@ -131,7 +150,7 @@ class ReportAgent:
                 "quality_score": quality_score,
                 "quality_breakdown": result.get("quality_breakdown", {}),
                 "follow_up_queries": result.get("follow_up_queries", []),
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": datetime.now().isoformat(timespec="seconds"),
             }
 
             logger.info(f"Report built. Quality score: {quality_score}/100")
@@ -152,72 +171,90 @@ class ReportAgent:
                 "report": fallback_report,
                 "quality_score": 30,
                 "status": f"Report fallback: {str(e)[:100]}",
-                "errors": state.get("errors", []) + [f"Report: {str(e)}"],
+                "errors": [f"Report: {str(e)}"],
             }
 
     @staticmethod
     def _format_verified_findings(findings: list[dict], verified: list[dict]) -> str:
         """Combine findings with their verification scores."""
-        parts = []
-        for i, f in enumerate(findings):
+        # Index verifications once instead of scanning them per finding.
+        # Keyed on the whitespace-normalized claim, with the 60-char prefix
+        # as a fallback; reversed() keeps the first match on duplicates.
+        by_claim = {" ".join(v.get("claim", "").split()): v for v in reversed(verified)}
+        by_prefix = {" ".join(v.get("claim", "").split())[:60]: v for v in reversed(verified)}
+
+        def line(f: dict) -> str:
             claim = f.get("claim", "")
-            # Find matching verification
-            vc = next(
-                (v for v in verified if v.get("claim", "")[:60] == claim[:60]),
-                {},
-            )
-            confidence = vc.get("confidence_score", "N/A")
-            status = vc.get("status", "unverified")
-            parts.append(f"- [{status}, {confidence}%] {claim}")
-        return "\n".join(parts) if parts else "No findings available."
+            key = " ".join(str(claim).split())
+            vc = by_claim.get(key) or by_prefix.get(key[:60], {})
+            return f"- [{vc.get('status', 'unverified')}, {vc.get('confidence_score', 'N/A')}%] {claim}"
+
+        return "\n".join(map(line, findings)) if findings else "No findings available."
 
     @staticmethod
     def _format_contradictions(contradictions: list[dict], gaps: list[str], warnings: list[str]) -> str:
         """Format contradictions, gaps, and warnings together."""
-        parts = []
+        # Fragments go into one flat list and are joined once, so no
+        # per-line intermediate string is built.
+        parts: list[str] = []
+        push = parts.extend
         if contradictions:
-            parts.append("CONTRADICTIONS:")
+            parts.append("CONTRADICTIONS:\n")
             for c in contradictions:
-                parts.append(f"  - {c.get('topic', '')}: {c.get('position_a', '')} vs {c.get('position_b', '')}")
+                get = c.get
+                push((
+                    "  - ", str(get("topic", "")), ": ", str(get("position_a", "")),
+                    " vs ", str(get("position_b", "")), "\n",
+                ))
         if gaps:
-            parts.append("\nGAPS IN RESEARCH:")
+            parts.append("\nGAPS IN RESEARCH:\n")
             for g in gaps:
-                parts.append(f"  - {g}")
+                push(("  - ", str(g), "\n"))
         if warnings:
-            parts.append("\nWARNINGS:")
+            parts.append("\nWARNINGS:\n")
             for w in warnings:
-                parts.append(f"  - {w}")
-        return "\n".join(parts) if parts else "No significant contradictions or gaps."
+                push(("  - ", str(w), "\n"))
+        if not parts:
+            return "No significant contradictions or gaps."
+        return "".join(parts)[:-1]
 
     @staticmethod
     def _format_insights(insights: dict) -> str:
         """Format insights for the report prompt."""
-        parts = []
+        parts: list[str] = []
+        push = parts.extend
         for h in insights.get("hypotheses", []):
-            parts.append(
-                f"HYPOTHESIS ({h.get('confidence', 'medium')} confidence): "
-                f"{h.get('statement', '')}"
-            )
+            push((
+                "HYPOTHESIS (", str(h.get("confidence", "medium")), " confidence): ",
+                str(h.get("statement", "")), "\n",
+            ))
         for t in insights.get("trends", []):
-            parts.append(
-                f"TREND ({t.get('direction', '')}): {t.get('description', '')}"
-            )
+            push(("TREND (", str(t.get("direction", "")), "): ", str(t.get("description", "")), "\n"))
         for p in insights.get("key_patterns", []):
-            parts.append(f"PATTERN: {p}")
+            push(("PATTERN: ", str(p), "\n"))
         for imp in insights.get("implications", []):
-            parts.append(f"IMPLICATION: {imp}")
-        return "\n".join(parts) if parts else "No insights generated."
+            push(("IMPLICATION: ", str(imp), "\n"))
+        if not parts:
+            return "No insights generated."
+        parts.pop()
+        return "".join(parts)
 
     @staticmethod
     def _format_sources_summary(sources: list[dict]) -> str:
         """Brief source summary for the report."""
-        parts = []
+        parts: list[str] = []
+        push = parts.extend
         for i, s in enumerate(sources):
-            parts.append(
-                f"[{i}] {s.get('title', 'Unknown')} "
-                f"({s.get('source_type', 'unknown')}) — {s.get('url', '')}"
-            )
-        return "\n".join(parts) if parts else "No sources available."
+            get = s.get
+            push((
+                "[", str(i), "] ", str(get("title", "Unknown")),
+                " (", str(get("source_type", "unknown")), ") — ", str(get("url", "")),
+                "\n",
+            ))
+        if not parts:
+            return "No sources available."
+        parts.pop()
+        return "".join(parts)
 
     @staticmethod
     def _build_fallback_report(
@@ -233,10 +270,10 @@ class ReportAgent:
             ),
             "key_findings": [
                 {"finding": f.get("claim", ""), "confidence": 50, "sources_count": len(f.get("source_indices", []))}
-                for f in analysis.get("findings", [])[:10]
+                for f in islice(analysis.get("findings") or (), 10)
             ],
             "contradictions_and_gaps": "Report builder error — review raw analysis data.",
-            "insights_and_trends": str(insights.get("hypotheses", [])),
+            "insights_and_trends": str(list(insights.get("hypotheses", []))),
             "source_reliability": f"Overall reliability: {fact_check.get('overall_reliability_score', 'N/A')}/100",
             "methodology_note": (
                 f"Note: Report assembly encountered an error ({error[:100]}). "
@@ -249,5 +286,5 @@ class ReportAgent:
             "quality_score": 30,
             "quality_breakdown": {},
             "follow_up_queries": [query],
-            "generated_at": datetime.now().isoformat(),
+            "generated_at": datetime.now().isoformat(timespec="seconds"),
         }
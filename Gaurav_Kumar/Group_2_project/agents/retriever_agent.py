@@ -14,32 +14,105 @@ OUTPUT (to state):
     sources: List[dict] — Deduplicated SourceDocument dicts.
 
 FEATURES:
-    - Parallel-like search across multiple sub-queries
-    - URL-based deduplication
-    - Source type categorization via LLM
+    - Concurrent search across sub-queries (settings.MAX_CONCURRENT_SEARCHES)
+    - Search results cached per normalized sub-query (settings.SEARCH_CACHE_TTL)
+    - Source content trimmed to settings.SOURCE_CONTENT_CHARS on arrival
+    - URL-based deduplication on canonical URLs (scheme, www., trailing
+      slash, fragments and tracking parameters ignored)
+    - Sub-queries already searched earlier in the run are not repeated
+    - Source type categorization: domain rules first, then the LLM for the
+      sources the rules cannot place, in concurrent chunks of
+      settings.CATEGORIZE_BATCH_SIZE with a per-chunk rule-based fallback
     - Graceful fallback if Tavily fails
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
-from dataclasses import dataclass, asdict
-from urllib.parse import urlparse
+import re
+from typing import TypedDict
+from urllib.parse import parse_qsl, urlencode, urlparse
 
 from tavily import TavilyClient
 
 from utils.llm_client import LLMClient
+from utils.prompt_template import compile_template
+from utils.cache import LRUCache, digest
 from prompts.retriever_prompt import SYSTEM_PROMPT, USER_PROMPT_TEMPLATE
 from config import settings
 
 logger = logging.getLogger(__name__)
 
+_render_user_prompt = compile_template(USER_PROMPT_TEMPLATE)
 
-@dataclass
-class SourceDocument:
+# Raw Tavily results keyed by (normalized sub-query, result count). Shared
+# across runs so a sub-query repeated in a reflection loop or a later
+# research session does not cost another API call.
+_search_cache = LRUCache(settings.SEARCH_CACHE_SIZE, ttl=settings.SEARCH_CACHE_TTL)
+
+# Fallback categorization rules, checked in priority order: a domain gets
+# the first type whose keywords appear anywhere in it. Each keyword set is
+# compiled into one alternation so a rule is a single regex scan.
+_DOMAIN_RULES: tuple[tuple[str, re.Pattern], ...] = tuple(
+    (source_type, re.compile("|".join(map(re.escape, keywords))))
+    for source_type, keywords in (
+        ("academic", (".edu", "arxiv", "scholar", "pubmed", "ncbi")),
+        ("government", (".gov", "government")),
+        ("news", ("reuters", "bbc", "nytimes", "cnn", "guardian", "apnews")),
+        ("encyclopedia", ("wikipedia", "britannica")),
+        ("blog", ("medium.com", "substack", "wordpress", "blogspot")),
+    )
+)
+
+
+def _normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a sub-query."""
+    return " ".join(query.lower().split())
+
+
+@functools.lru_cache(maxsize=4096)
+def _domain_of(url: str) -> str:
+    """Domain of a URL without the leading 'www.' (memoized per URL)."""
+    return urlparse(url).netloc.replace("www.", "")
+
+
+# Per-field cap on titles/URLs in the categorization prompt, so one
+# pathological search hit cannot blow up a chunk's prompt
+CATEGORIZE_FIELD_CHARS = 200
+
+# Query parameters that only track the click, never change the page
+_TRACKING_PARAMS = frozenset({"fbclid", "gclid", "mc_cid", "mc_eid"})
+
+
+@functools.lru_cache(maxsize=4096)
+def _canonical_url(url: str) -> str:
+    """
+    Canonical form of a URL for deduplication (memoized per URL).
+
+    Drops the scheme, a leading 'www.', the fragment, utm_* and other
+    tracking parameters, and a trailing slash; lowercases the host.
+    """
+    parts = urlparse(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = urlencode([
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if not k.startswith("utm_") and k not in _TRACKING_PARAMS
+    ])
+    path = parts.path.rstrip("/")
+    return f"{host}{path}?{query}" if query else f"{host}{path}"
+
+
+class SourceDocument(TypedDict):
     """
     A single web source collected by the Retriever Agent.
 
+    A TypedDict because sources live in state["sources"] as plain dicts;
+    constructing one is a dict literal, with no asdict() conversion.
+
     Attributes:
         title: The page title.
         url: The full URL.
@@ -52,10 +125,10 @@ class SourceDocument:
     title: str
     url: str
     content: str
-    source_type: str = "other"
-    relevance_score: float = 0.0
-    domain: str = ""
-    sub_query: str = ""
+    source_type: str
+    relevance_score: float
+    domain: str
+    sub_query: str
 
 
 class RetrieverAgent:
@@ -72,78 +145,136 @@ class RetrieverAgent:
         self.tavily_calls: int = 0  # Track number of Tavily API calls
 
     def run(self, state: dict) -> dict:
+        """
+        Synchronous entry point: retrieve sources for all sub-queries.
+
+        Args:
+            state: Current ResearchState dict.
+
+        Returns:
+            State update (see arun).
+        """
+        return asyncio.run(self.arun(state))
+
+    async def arun(self, state: dict) -> dict:
         """
         LangGraph node function: retrieve sources for all sub-queries.
 
+        Searches run concurrently on worker threads (the Tavily SDK is
+        blocking), at most settings.MAX_CONCURRENT_SEARCHES at a time.
+        Deduplication happens afterwards in sub-query order, so the result
+        is the same as searching one query after another.
+
         Args:
             state: Current ResearchState dict.
 
         Returns:
             State update with sources list.
         """
-        sub_queries = state.get("sub_queries", [])
-        existing_urls = {s["url"] for s in state.get("sources", [])}
+        existing_sources = state.get("sources", [])
+        existing_urls = {_canonical_url(s["url"]) for s in existing_sources}
+
+        # A sub-query that already produced sources in this run can only
+        # return URLs that are in existing_urls by now, so refinement
+        # repeats are skipped instead of searched and deduplicated away.
+        searched = {_normalize_query(s["sub_query"]) for s in existing_sources}
+        sub_queries = [
+            q for q in state.get("sub_queries", [])
+            if _normalize_query(q) not in searched
+        ]
+        if skipped := len(state.get("sub_queries", [])) - len(sub_queries):
+            logger.info(f"Skipping {skipped} already-searched sub-query(s)")
+
         all_sources: list[SourceDocument] = []
 
-        for i, query in enumerate(sub_queries):
-            logger.info(f"Searching sub-query {i+1}/{len(sub_queries)}: {query}")
-            try:
-                results = self._search(query)
-                for src in results:
-                    if src.url not in existing_urls:
-                        existing_urls.add(src.url)
-                        all_sources.append(src)
-            except Exception as e:
-                logger.error(f"Search failed for '{query}': {e}")
+        gate = asyncio.Semaphore(max(1, settings.MAX_CONCURRENT_SEARCHES))
+
+        async def search(i: int, query: str) -> list[SourceDocument]:
+            key = digest(_normalize_query(query), str(settings.MAX_SEARCH_RESULTS))
+            raw = _search_cache.get(key)
+            if raw is not None:
+                logger.info(f"Search cache hit for sub-query {i+1}/{len(sub_queries)}: {query}")
+            else:
+                async with gate:
+                    logger.info(f"Searching sub-query {i+1}/{len(sub_queries)}: {query}")
+                    self.tavily_calls += 1
+                    raw = await asyncio.to_thread(self._search, query)
+                _search_cache.put(key, raw)
+            return self._to_sources(query, raw)
+
+        results = await asyncio.gather(
+            *(search(i, query) for i, query in enumerate(sub_queries)),
+            return_exceptions=True,
+        )
+
+        for query, result in zip(sub_queries, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Search failed for '{query}': {result}")
                 continue
+            for src in result:
+                canonical = _canonical_url(src["url"])
+                if canonical not in existing_urls:
+                    existing_urls.add(canonical)
+                    all_sources.append(src)
 
         # Categorize sources using LLM
         if all_sources:
-            all_sources = self._categorize_sources(all_sources)
+            all_sources = await self._categorize_sources(all_sources)
 
         logger.info(f"Retrieved {len(all_sources)} unique sources total")
 
         # Combine with existing sources from previous iterations
-        existing_sources = state.get("sources", [])
-        new_sources_dicts = [asdict(s) for s in all_sources]
-
         return {
-            "sources": existing_sources + new_sources_dicts,
+            "sources": existing_sources + all_sources,
             "status": f"Retrieved {len(all_sources)} new sources ({len(existing_sources) + len(all_sources)} total)",
         }
 
-    def _search(self, query: str) -> list[SourceDocument]:
+    def _search(self, query: str) -> list[dict]:
         """
-        Execute a single Tavily search and convert results to SourceDocuments.
+        Execute a single Tavily search.
 
         Args:
             query: The search query string.
 
         Returns:
-            List of SourceDocument objects.
+            Tavily's raw result dicts.
         """
-        self.tavily_calls += 1
         response = self.tavily.search(
             query=query,
             max_results=settings.MAX_SEARCH_RESULTS,
             include_answer=False,
             search_depth="advanced",
         )
+        return response.get("results", [])
 
+    @staticmethod
+    def _to_sources(query: str, results: list[dict]) -> list[SourceDocument]:
+        """
+        Convert raw Tavily results to SourceDocuments.
+
+        Args:
+            query: The sub-query that produced the results.
+            results: Raw result dicts from _search.
+
+        Returns:
+            List of SourceDocument dicts.
+        """
         sources = []
-        for result in response.get("results", []):
-            domain = urlparse(result.get("url", "")).netloc.replace("www.", "")
+        for result in results:
+            domain = _domain_of(result.get("url", ""))
             content = result.get("content", "")
 
-            # Truncate very long content to ~800 words
-            words = content.split()
-            if len(words) > 800:
-                content = " ".join(words[:800]) + "..."
+            # Keep only as much content as any later stage reads (the
+            # analysis prompt's excerpt). Sources stay in state for every
+            # remaining node and iteration, so the tail would only be
+            # carried around in each state snapshot and never used.
+            content = content[:settings.SOURCE_CONTENT_CHARS]
 
             sources.append(SourceDocument(
                 title=result.get("title", "Untitled"),
                 url=result.get("url", ""),
                 content=content,
+                source_type="other",
                 relevance_score=result.get("score", 0.0),
                 domain=domain,
                 sub_query=query,
@@ -151,53 +282,78 @@ class RetrieverAgent:
 
         return sources
 
-    def _categorize_sources(self, sources: list[SourceDocument]) -> list[SourceDocument]:
+    async def _categorize_sources(self, sources: list[SourceDocument]) -> list[SourceDocument]:
         """
         Use LLM to categorize source types and domain authority.
 
+        Domain rules run first. Only sources they leave as "other" go to
+        the LLM, and only if those are at least
+        settings.CATEGORIZE_LLM_MIN_UNKNOWN of the batch. Unknowns are sent
+        in concurrent chunks of settings.CATEGORIZE_BATCH_SIZE, so prompts
+        stay small and one bad response only affects its own chunk.
+
         Args:
             sources: List of uncategorized SourceDocuments.
 
         Returns:
             Same list with source_type updated.
         """
-        sources_text = "\n".join(
-            f"[{i}] Domain: {s.domain} | Title: {s.title} | URL: {s.url}"
-            for i, s in enumerate(sources)
-        )
+        unknown = []
+        for s in sources:
+            s["source_type"] = self._fallback_categorize(s["domain"])
+            if s["source_type"] == "other":
+                unknown.append(s)
+
+        if len(unknown) < settings.CATEGORIZE_LLM_MIN_UNKNOWN * len(sources):
+            logger.info(
+                f"Domain rules categorized {len(sources) - len(unknown)}/{len(sources)} "
+                "sources; skipping LLM categorization"
+            )
+            return sources
+
+        # Chunks hold the same dicts as `sources`, so updates land in place
+        batch_size = max(1, settings.CATEGORIZE_BATCH_SIZE)
+        await asyncio.gather(*(
+            self._categorize_chunk(unknown[start:start + batch_size])
+            for start in range(0, len(unknown), batch_size)
+        ))
+        return sources
 
+    async def _categorize_chunk(self, chunk: list[SourceDocument]) -> None:
+        """Categorize one chunk in place, falling back to domain rules on failure."""
+        cap = CATEGORIZE_FIELD_CHARS
         try:
-            user_prompt = USER_PROMPT_TEMPLATE.format(
-                count=len(sources),
+            sources_text = "\n".join(
+                f"[{i}] Domain: {str(s['domain'])[:cap]} | Title: {str(s['title'])[:cap]} | URL: {str(s['url'])[:cap]}"
+                for i, s in enumerate(chunk)
+            )
+            user_prompt = _render_user_prompt(
+                count=len(chunk),
                 sources_text=sources_text,
             )
-            result = self.llm.chat_json(SYSTEM_PROMPT, user_prompt)
+            result = await self.llm.achat_json(SYSTEM_PROMPT, user_prompt)
 
             for item in result.get("sources", []):
                 idx = item.get("index", -1)
-                if 0 <= idx < len(sources):
-                    sources[idx].source_type = item.get("source_type", "other")
+                if 0 <= idx < len(chunk):
+                    chunk[idx]["source_type"] = item.get("source_type", "other")
 
         except Exception as e:
             logger.warning(f"Source categorization failed: {e}. Using defaults.")
             # Fallback: simple domain-based categorization
-            for s in sources:
-                s.source_type = self._fallback_categorize(s.domain)
-
-        return sources
+            for s in chunk:
+                s["source_type"] = self._fallback_categorize(s["domain"])
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def _fallback_categorize(domain: str) -> str:
-        """Simple rule-based source categorization as fallback."""
+        """
+        Simple rule-based source categorization as fallback.
+
+        Memoized: the same domains recur across sub-queries and iterations.
+        """
         domain = domain.lower()
-        if any(x in domain for x in [".edu", "arxiv", "scholar", "pubmed", "ncbi"]):
-            return "academic"
-        if any(x in domain for x in [".gov", "government"]):
-            return "government"
-        if any(x in domain for x in ["reuters", "bbc", "nytimes", "cnn", "guardian", "apnews"]):
-            return "news"
-        if any(x in domain for x in ["wikipedia", "britannica"]):
-            return "encyclopedia"
-        if any(x in domain for x in ["medium.com", "substack", "wordpress", "blogspot"]):
-            return "blog"
+        for source_type, pattern in _DOMAIN_RULES:
+            if pattern.search(domain):
+                return source_type
         return "other"
@@ -18,14 +18,25 @@ Features:
 from __future__ import annotations
 
 import time
+import html
+import bisect
 import logging
 import streamlit as st
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
-from config import settings, AVAILABLE_MODELS
+from config import (
+    settings,
+    AVAILABLE_MODELS,
+    MODEL_DISPLAY_NAMES,
+    MODEL_VALUE_TO_DISPLAY_INDEX,
+)
 from utils.llm_client import LLMClient
 from utils.callbacks import ProgressTracker
 from agents.report_agent import ReportResult
+from orchestrator.graph import run_research
+from utils.pdf_export import generate_pdf_bytes
 
 logger = logging.getLogger(__name__)
 
@@ -34,11 +45,118 @@ logger = logging.getLogger(__name__)
 # Helper Functions (defined early so Streamlit can find them)
 # ─────────────────────────────────────────────
 
+# Confidence badge classes: < 50 low, 50–69 medium, >= 70 high.
+_CONFIDENCE_CUTS = (50, 70)
+_CONFIDENCE_CLASSES = ("confidence-low", "confidence-medium", "confidence-high")
+
+
+def _confidence_badge(confidence) -> str:
+    """Return the HTML badge span for a finding's confidence value."""
+    if isinstance(confidence, (int, float)):
+        badge_class = _CONFIDENCE_CLASSES[bisect.bisect_right(_CONFIDENCE_CUTS, confidence)]
+        return f'<span class="{badge_class}">{confidence}%</span>'
+    return f'<span class="confidence-medium">{confidence}</span>'
+
+
+def _findings_markdown(findings: list) -> str:
+    """
+    Render the Key Findings tab as one markdown string.
+
+    One element for the whole list instead of a markdown + caption +
+    divider trio per finding.
+    """
+    parts = []
+    for i, f in enumerate(findings, 1):
+        badge = _confidence_badge(f.get("confidence", 50))
+        parts.append(f"**{i}.** {badge} {f.get('finding', '')}")
+        sources_count = f.get("sources_count", 0)
+        if sources_count:
+            parts.append(
+                f'<span class="finding-caption">Supported by {sources_count} source(s)</span>'
+            )
+        parts.append("---")
+    return "\n\n".join(parts)
+
+
+def _source_distribution_html(sources: list) -> str:
+    """Render the Sources tab's per-type counts as one HTML block."""
+    type_counts = Counter(s.get("source_type", "unknown") for s in sources)
+    # source_type can come from the LLM, so escape it before it goes into
+    # HTML rendered with unsafe_allow_html
+    cells = "".join(
+        f'<div class="source-dist-cell"><span>{html.escape(str(stype).title())}</span>'
+        f"<strong>{count}</strong></div>"
+        for stype, count in type_counts.most_common()
+    )
+    return f'<div class="source-dist">{cells}</div>'
+
+
+_HYPOTHESIS_ICONS = {"high": "🟢", "medium": "🟡"}  # anything else: 🔴
+_TREND_ICONS = {
+    "increasing": "📈",
+    "decreasing": "📉",
+    "emerging": "🌱",
+    "shifting": "🔄",
+    "stable": "➡️",
+}
+
+
+def _hypotheses_markdown(hypotheses: list) -> list[tuple[str, str]]:
+    """Return (expander label, body markdown) pairs for the Insights tab."""
+    out = []
+    for h in hypotheses:
+        confidence = h.get("confidence")
+        parts = [
+            f"**Confidence:** {h.get('confidence', 'unknown')}",
+            f"**Reasoning:** {h.get('reasoning_chain', 'N/A')}",
+        ]
+        evidence = h.get("supporting_evidence", [])
+        if evidence:
+            parts.append("**Evidence:**")
+            parts.append("\n".join(f"- {e}" for e in evidence))
+        out.append((
+            f"{_HYPOTHESIS_ICONS.get(confidence, '🔴')} {h.get('statement', '')}",
+            "\n\n".join(parts),
+        ))
+    return out
+
+
+def _trends_markdown(trends: list) -> str:
+    """Render the Insights tab's trend list as one markdown string."""
+    parts = []
+    for t in trends:
+        icon = _TREND_ICONS.get(t.get("direction", ""), "📊")
+        parts.extend((
+            f"{icon} **{t.get('description', '')}**",
+            f'<span class="finding-caption">Direction: {t.get("direction", "unknown")} | '
+            f'Timeframe: {t.get("timeframe", "unknown")}</span>',
+        ))
+    return "\n\n".join(parts)
+
+
+def _prepare_display(result: dict) -> None:
+    """
+    Precompute the result's rendered tab content once, when it is stored.
+
+    Stored under result["_display"]; reruns read the strings instead of
+    rebuilding them. Results stored without it are rendered on the fly.
+    """
+    report = result.get("report", {})
+    insights = result.get("insights", {})
+    result["_display"] = {
+        "findings": _findings_markdown(report.get("key_findings", [])),
+        "source_distribution": _source_distribution_html(result.get("sources", [])),
+        "hypotheses": _hypotheses_markdown(insights.get("hypotheses", [])),
+        "trends": _trends_markdown(insights.get("trends", [])),
+    }
+
+
+@st.cache_data(show_spinner=False, max_entries=16)
 def _build_markdown_report(report: dict, sources: list) -> str:
-    """Build a Markdown version of the report for download."""
+    """Build a Markdown version of the report for download (cached per report)."""
     lines = [
         f"# {report.get('title', 'Research Report')}",
-        f"*Generated: {report.get('generated_at', datetime.now().isoformat())}*",
+        f"*Generated: {report.get('generated_at', datetime.now().isoformat(timespec='seconds'))}*",
         f"*Quality Score: {report.get('quality_score', 0)}/100*",
         "",
         "## Executive Summary",
@@ -73,6 +191,123 @@ def _build_markdown_report(report: dict, sources: list) -> str:
 
     return "\n".join(lines)
 
+
+def _render_history() -> None:
+    """Render the sidebar Research History list."""
+    if st.session_state.research_history:
+        for i, entry in enumerate(reversed(st.session_state.research_history)):
+            timestamp = entry.get("timestamp", "")
+            query = entry.get("query", "")[:50]
+            score = entry.get("quality_score", 0)
+            with st.expander(f"{query}...", expanded=False):
+                st.caption(f"Time: {timestamp}")
+                st.caption(f"Quality: {score}/100")
+                if st.button(f"Load", key=f"load_{i}"):
+                    _set_current_result(entry.get("result"))
+                    st.rerun()
+    else:
+        st.caption("No research sessions yet.")
+
+
+def _render_usage_stats(current: dict | None) -> None:
+    """Render the sidebar Usage Stats body for a research result."""
+    if current and current.get("usage_stats"):
+        usage = current["usage_stats"]
+        by_agent = usage.get("by_agent", {})
+        total_tok = usage.get("total_tokens", 0)
+        total_calls = usage.get("total_calls", 0)
+        tavily_calls = usage.get("tavily_calls", 0)
+
+        # Summary metrics
+        st.metric("Total LLM Tokens", f"{total_tok:,}")
+        cols = st.columns(2)
+        with cols[0]:
+            st.metric("LLM Calls", total_calls)
+        with cols[1]:
+            st.metric("Tavily Searches", tavily_calls)
+        if usage.get("cache_hits"):
+            st.caption(f"{usage['cache_hits']} LLM call(s) answered from cache")
+
+        # Per-agent token breakdown
+        with st.expander("Token Breakdown by Agent", expanded=True):
+            # Agent order for display
+            agent_order = ["Decomposer", "Retriever", "Analyzer", "Fact-Checker", "Insight", "Reporter"]
+            # Built as one HTML block: a markdown + progress widget pair per
+            # agent meant a dozen separate elements on every rerun.
+            rows = []
+            for agent_name in agent_order:
+                if agent_name in by_agent:
+                    a = by_agent[agent_name]
+                    pct = min(a["total_tokens"] / total_tok * 100, 100) if total_tok > 0 else 0
+                    rows.extend((
+                        f'<div class="agent-row"><b>{agent_name}</b> — '
+                        f"<code>{a['total_tokens']:,}</code> tokens "
+                        f"({a['calls']} call{'s' if a['calls'] != 1 else ''})",
+                        f'<div class="agent-bar"><div class="agent-bar-fill" '
+                        f'style="width:{pct:.1f}%"></div></div></div>',
+                    ))
+            # Any agents not in the predefined order
+            for agent_name, a in by_agent.items():
+                if agent_name not in agent_order:
+                    rows.append(
+                        f'<div class="agent-row"><b>{agent_name}</b> — '
+                        f"<code>{a['total_tokens']:,}</code> tokens</div>"
+                    )
+            if rows:
+                st.markdown("".join(rows), unsafe_allow_html=True)
+
+        # Sub-queries used
+        sub_queries = current.get("sub_queries", [])
+        if sub_queries:
+            with st.expander(f"Sub-Queries ({len(sub_queries)})", expanded=True):
+                for i, sq in enumerate(sub_queries, 1):
+                    st.markdown(f"{i}. {sq}")
+    else:
+        st.caption("Run a research query to see usage stats.")
+
+
+@st.cache_resource
+def _export_executor() -> ThreadPoolExecutor:
+    """Process-wide worker pool for export rendering (survives reruns)."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="export")
+
+
+def _set_current_result(result: dict | None) -> None:
+    """
+    Make `result` the displayed result and start rendering its PDF export.
+
+    The render is submitted once per result and its future kept in session
+    state, so later reruns (widget clicks) reuse it. The worker calls the
+    plain generator: st.cache_data needs a script context, which pool
+    threads do not have.
+    """
+    st.session_state.current_result = result
+    st.session_state.pdf_future = (
+        _export_executor().submit(
+            generate_pdf_bytes, result["report"], result.get("sources", [])
+        )
+        if result and result.get("report")
+        else None
+    )
+
+
+EXAMPLE_QUERIES: tuple[str, ...] = (
+    "Impact of quantum computing on cybersecurity by 2030",
+    "Latest breakthroughs in nuclear fusion energy 2024-2025",
+    "How is AI changing drug discovery and pharmaceutical R&D?",
+    "Global water scarcity crisis: causes, effects, and solutions",
+    "Rise of lab-grown meat: environmental and economic impact",
+    "Future of remote work: productivity data and trends",
+)
+
+
+def _use_example_query() -> None:
+    """Copy the picked example into the search box and clear the pick."""
+    picked = st.session_state.get("example_pick")
+    if picked:
+        st.session_state["research_query"] = picked
+        st.session_state["example_pick"] = None
+
 # ─────────────────────────────────────────────
 # Page Configuration
 # ─────────────────────────────────────────────
@@ -132,6 +367,20 @@ st.markdown("""
         font-weight: bold;
     }
 
+    /* Sources tab type distribution */
+    .source-dist { display: flex; flex-wrap: wrap; gap: 1.5rem; }
+    .source-dist-cell span {
+        display: block;
+        font-size: 0.875rem;
+        color: rgba(128, 132, 149, 1);
+    }
+    .source-dist-cell strong { font-size: 1.75rem; font-weight: 400; }
+
+    .finding-caption {
+        color: rgba(128, 132, 149, 1);
+        font-size: 0.875rem;
+    }
+
     /* Quality score display */
     .quality-score-box {
         text-align: center;
@@ -160,6 +409,21 @@ st.markdown("""
     /* Stat boxes */
     .stMetric { border-radius: 8px; }
 
+    /* Sidebar token breakdown */
+    .agent-row { margin-bottom: 0.6rem; font-size: 0.9rem; }
+    .agent-row code { font-size: 0.8rem; }
+    .agent-bar {
+        background: rgba(151, 166, 195, 0.25);
+        border-radius: 4px;
+        height: 6px;
+        margin-top: 0.25rem;
+    }
+    .agent-bar-fill {
+        background: #e94560;
+        border-radius: 4px;
+        height: 100%;
+    }
+
     /* Hide Streamlit branding */
     #MainMenu {visibility: hidden;}
     footer {visibility: hidden;}
@@ -171,9 +435,13 @@ st.markdown("""
 # Session State Initialization
 # ─────────────────────────────────────────────
 if "research_history" not in st.session_state:
-    st.session_state.research_history = []
+    # Bounded: each entry holds a full result (sources, report, ...), so an
+    # unbounded list would grow session memory for as long as the tab is open.
+    st.session_state.research_history = deque(maxlen=settings.MAX_RESEARCH_HISTORY)
 if "current_result" not in st.session_state:
     st.session_state.current_result = None
+if "pdf_future" not in st.session_state:
+    _set_current_result(st.session_state.current_result)
 if "is_researching" not in st.session_state:
     st.session_state.is_researching = False
 
@@ -187,10 +455,8 @@ with st.sidebar:
     # Model selection
     model_display = st.selectbox(
         "LLM Model",
-        options=list(AVAILABLE_MODELS.keys()),
-        index=list(AVAILABLE_MODELS.values()).index(settings.DEFAULT_MODEL)
-        if settings.DEFAULT_MODEL in AVAILABLE_MODELS.values()
-        else 0,
+        options=MODEL_DISPLAY_NAMES,
+        index=MODEL_VALUE_TO_DISPLAY_INDEX.get(settings.DEFAULT_MODEL, 0),
         help="Select the LLM model for analysis. Free models have usage limits.",
     )
     selected_model = AVAILABLE_MODELS[model_display]
@@ -218,19 +484,9 @@ with st.sidebar:
 
     # Research History
     st.markdown("## Research History")
-    if st.session_state.research_history:
-        for i, entry in enumerate(reversed(st.session_state.research_history)):
-            timestamp = entry.get("timestamp", "")
-            query = entry.get("query", "")[:50]
-            score = entry.get("quality_score", 0)
-            with st.expander(f"{query}...", expanded=False):
-                st.caption(f"Time: {timestamp}")
-                st.caption(f"Quality: {score}/100")
-                if st.button(f"Load", key=f"load_{i}"):
-                    st.session_state.current_result = entry.get("result")
-                    st.rerun()
-    else:
-        st.caption("No research sessions yet.")
+    # Filled at the end of the script run so a just-finished research
+    # run shows up without a full st.rerun().
+    history_slot = st.empty()
 
     st.divider()
 
@@ -247,49 +503,7 @@ with st.sidebar:
 
     # ── Usage Stats Widget ─────────────────────────────────
     st.markdown("## Usage Stats")
-    _current = st.session_state.get("current_result")
-    if _current and _current.get("usage_stats"):
-        _usage = _current["usage_stats"]
-        _by_agent = _usage.get("by_agent", {})
-        _total_tok = _usage.get("total_tokens", 0)
-        _total_calls = _usage.get("total_calls", 0)
-        _tavily_calls = _usage.get("tavily_calls", 0)
-
-        # Summary metrics
-        st.metric("Total LLM Tokens", f"{_total_tok:,}")
-        _cols = st.columns(2)
-        with _cols[0]:
-            st.metric("LLM Calls", _total_calls)
-        with _cols[1]:
-            st.metric("Tavily Searches", _tavily_calls)
-
-        # Per-agent token breakdown
-        with st.expander("Token Breakdown by Agent", expanded=True):
-            # Agent order for display
-            _agent_order = ["Decomposer", "Retriever", "Analyzer", "Fact-Checker", "Insight", "Reporter"]
-            for _agent_name in _agent_order:
-                if _agent_name in _by_agent:
-                    _a = _by_agent[_agent_name]
-                    _pct = (_a["total_tokens"] / _total_tok * 100) if _total_tok > 0 else 0
-                    st.markdown(
-                        f"**{_agent_name}** — "
-                        f"`{_a['total_tokens']:,}` tokens "
-                        f"({_a['calls']} call{'s' if _a['calls'] != 1 else ''})"
-                    )
-                    st.progress(min(_pct / 100, 1.0))
-            # Any agents not in the predefined order
-            for _agent_name, _a in _by_agent.items():
-                if _agent_name not in _agent_order:
-                    st.markdown(f"**{_agent_name}** — `{_a['total_tokens']:,}` tokens")
-
-        # Sub-queries used
-        _sub_queries = _current.get("sub_queries", [])
-        if _sub_queries:
-            with st.expander(f"Sub-Queries ({len(_sub_queries)})", expanded=True):
-                for _i, _sq in enumerate(_sub_queries, 1):
-                    st.markdown(f"{_i}. {_sq}")
-    else:
-        st.caption("Run a research query to see usage stats.")
+    usage_slot = st.empty()
 
 
 # ─────────────────────────────────────────────
@@ -304,10 +518,6 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
-# Pre-populate search box when an example topic is clicked
-if "_example_query" in st.session_state:
-    st.session_state["research_query"] = st.session_state.pop("_example_query")
-
 # Research Input
 col1, col2 = st.columns([5, 1])
 with col1:
@@ -327,21 +537,15 @@ with col2:
 
 # Example queries
 with st.expander("💡 Example Research Topics", expanded=not bool(st.session_state.current_result)):
-    example_cols = st.columns(3)
-    examples = [
-        "Impact of quantum computing on cybersecurity by 2030",
-        "Latest breakthroughs in nuclear fusion energy 2024-2025",
-        "How is AI changing drug discovery and pharmaceutical R&D?",
-        "Global water scarcity crisis: causes, effects, and solutions",
-        "Rise of lab-grown meat: environmental and economic impact",
-        "Future of remote work: productivity data and trends",
-    ]
-    for i, example in enumerate(examples):
-        col = example_cols[i % 3]
-        with col:
-            if st.button(example, key=f"example_{i}", use_container_width=True):
-                st.session_state["_example_query"] = example
-                st.rerun()
+    # One pills widget instead of six buttons; the callback fills the
+    # search box before the rerun, so no extra st.rerun() is needed.
+    st.pills(
+        "Try an example",
+        EXAMPLE_QUERIES,
+        key="example_pick",
+        on_change=_use_example_query,
+        label_visibility="collapsed",
+    )
 
 # ─────────────────────────────────────────────
 # Research Execution
@@ -356,14 +560,11 @@ if research_clicked and query:
         st.stop()
 
     st.session_state.is_researching = True
-    st.session_state.current_result = None
+    _set_current_result(None)
 
     # Initialize LLM with selected model
     llm = LLMClient(model=selected_model)
 
-    # Override settings for this run
-    settings.QUALITY_THRESHOLD = float(quality_threshold)
-
     st.divider()
     st.markdown(f"### Researching: *{query}*")
 
@@ -372,8 +573,6 @@ if research_clicked and query:
     start_time = time.time()
 
     with st.status("🔬 Running multi-agent research pipeline...", expanded=True) as status:
-        from orchestrator.graph import run_research
-
         # Show pipeline config
         st.write(f"**Model:** {model_display}")
         st.write(f"**Max iterations:** {max_iterations}")
@@ -389,6 +588,7 @@ if research_clicked and query:
             llm=llm,
             tracker=tracker,
             max_iterations=max_iterations,
+            quality_threshold=quality_threshold,
         )
 
         elapsed = time.time() - start_time
@@ -406,7 +606,8 @@ if research_clicked and query:
             )
 
     # Store result and add to history
-    st.session_state.current_result = result
+    _prepare_display(result)
+    _set_current_result(result)
     st.session_state.is_researching = False
 
     st.session_state.research_history.append({
@@ -416,8 +617,14 @@ if research_clicked and query:
         "result": result,
     })
 
-    # Rerun so the sidebar picks up usage_stats & sub-queries
-    st.rerun()
+
+# ─────────────────────────────────────────────
+# Sidebar: History & Usage Stats (latest result)
+# ─────────────────────────────────────────────
+with history_slot.container():
+    _render_history()
+with usage_slot.container():
+    _render_usage_stats(st.session_state.get("current_result"))
 
 
 # ─────────────────────────────────────────────
@@ -431,6 +638,10 @@ if result and result.get("report"):
     sources = result.get("sources", [])
     fact_check = result.get("fact_check", {})
     insights = result.get("insights", {})
+    display = result.get("_display", {})
+
+    # Started when the result was stored; the Export tab only joins it
+    pdf_future = st.session_state.pdf_future
 
     st.divider()
 
@@ -478,27 +689,8 @@ if result and result.get("report"):
     with tab2:
         findings = report.get("key_findings", [])
         if findings:
-            for i, f in enumerate(findings, 1):
-                confidence = f.get("confidence", 50)
-                if isinstance(confidence, (int, float)):
-                    if confidence >= 70:
-                        badge_class = "confidence-high"
-                    elif confidence >= 50:
-                        badge_class = "confidence-medium"
-                    else:
-                        badge_class = "confidence-low"
-                    badge = f'<span class="{badge_class}">{confidence}%</span>'
-                else:
-                    badge = f'<span class="confidence-medium">{confidence}</span>'
-
-                st.markdown(
-                    f"**{i}.** {badge} {f.get('finding', '')}",
-                    unsafe_allow_html=True,
-                )
-                sources_count = f.get("sources_count", 0)
-                if sources_count:
-                    st.caption(f"Supported by {sources_count} source(s)")
-                st.divider()
+            findings_md = display.get("findings") or _findings_markdown(findings)
+            st.markdown(findings_md, unsafe_allow_html=True)
         else:
             st.info("No key findings extracted.")
 
@@ -521,57 +713,34 @@ if result and result.get("report"):
         hypotheses = insights.get("hypotheses", [])
         if hypotheses:
             st.markdown("### Hypotheses")
-            for h in hypotheses:
-                with st.expander(
-                    f"{'🟢' if h.get('confidence') == 'high' else '🟡' if h.get('confidence') == 'medium' else '🔴'} "
-                    f"{h.get('statement', '')}",
-                    expanded=False,
-                ):
-                    st.markdown(f"**Confidence:** {h.get('confidence', 'unknown')}")
-                    st.markdown(f"**Reasoning:** {h.get('reasoning_chain', 'N/A')}")
-                    evidence = h.get("supporting_evidence", [])
-                    if evidence:
-                        st.markdown("**Evidence:**")
-                        for e in evidence:
-                            st.markdown(f"- {e}")
+            for label, body in display.get("hypotheses") or _hypotheses_markdown(hypotheses):
+                with st.expander(label, expanded=False):
+                    st.markdown(body)
 
         # Show trends
         trends = insights.get("trends", [])
         if trends:
             st.markdown("### Trends")
-            for t in trends:
-                direction_icon = {
-                    "increasing": "📈",
-                    "decreasing": "📉",
-                    "emerging": "🌱",
-                    "shifting": "🔄",
-                    "stable": "➡️",
-                }.get(t.get("direction", ""), "📊")
-                st.markdown(f"{direction_icon} **{t.get('description', '')}**")
-                st.caption(f"Direction: {t.get('direction', 'unknown')} | Timeframe: {t.get('timeframe', 'unknown')}")
+            st.markdown(
+                display.get("trends") or _trends_markdown(trends),
+                unsafe_allow_html=True,
+            )
 
         # Show further questions
         further_q = insights.get("further_questions", [])
         if further_q:
             st.markdown("### 🔮 Suggested Follow-up Questions")
-            for q in further_q:
-                st.markdown(f"- {q}")
+            st.markdown("\n".join(f"- {q}" for q in further_q))
 
     # Tab 5: Sources
     with tab5:
         if sources:
             # Source type distribution
-            type_counts = {}
-            for s in sources:
-                t = s.get("source_type", "unknown")
-                type_counts[t] = type_counts.get(t, 0) + 1
-
             st.markdown(f"### Source Distribution ({len(sources)} total)")
-
-            dist_cols = st.columns(len(type_counts) if type_counts else 1)
-            for i, (stype, count) in enumerate(sorted(type_counts.items(), key=lambda x: -x[1])):
-                with dist_cols[i % len(dist_cols)]:
-                    st.metric(stype.title(), count)
+            st.markdown(
+                display.get("source_distribution") or _source_distribution_html(sources),
+                unsafe_allow_html=True,
+            )
 
             st.divider()
 
@@ -585,13 +754,10 @@ if result and result.get("report"):
                     st.markdown(f"**Domain:** {src.get('domain', 'unknown')}")
                     st.markdown(f"**Relevance:** {src.get('relevance_score', 0):.2f}")
                     st.markdown(f"**Sub-query:** {src.get('sub_query', 'N/A')}")
-                    st.text_area(
-                        "Content",
-                        src.get("content", "")[:1000],
-                        height=150,
-                        key=f"source_content_{i}",
-                        disabled=True,
-                    )
+                    # Plain-text preview: st.code skips the markdown pipeline
+                    # and, unlike a text_area, registers no widget state.
+                    preview = (src.get("content") or "")[:1000]
+                    st.code(preview, language=None, wrap_lines=True)
         else:
             st.info("No sources collected.")
 
@@ -601,10 +767,9 @@ if result and result.get("report"):
         st.markdown("Download the research report in your preferred format.")
         st.markdown("")
 
-        # Pre-generate PDF bytes (no rerun needed)
-        from utils.pdf_export import generate_pdf_bytes
+        # PDF bytes from the background render (one per result)
         try:
-            pdf_bytes = generate_pdf_bytes(report, sources)
+            pdf_bytes = pdf_future.result()
             pdf_ready = True
         except Exception as e:
             pdf_bytes = None
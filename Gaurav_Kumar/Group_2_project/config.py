@@ -47,18 +47,30 @@ AVAILABLE_MODELS: dict[str, str] = {
     "Claude 3.5 Sonnet (Balanced)":     "anthropic/claude-3.5-sonnet",
 }
 
+# Precomputed views for the sidebar model selector (options list and
+# model id -> option index), so reruns don't rebuild and scan lists.
+MODEL_DISPLAY_NAMES: tuple[str, ...] = tuple(AVAILABLE_MODELS)
+MODEL_VALUE_TO_DISPLAY_INDEX: dict[str, int] = {
+    model: i for i, model in enumerate(AVAILABLE_MODELS.values())
+}
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Settings:
     """
     All application settings, loaded from environment variables.
 
+    Frozen and slotted: the instance is shared by every session in the
+    process, so per-run overrides (e.g. the UI's quality threshold) are
+    passed to run_research rather than assigned here.
+
     Attributes:
         OPENROUTER_API_KEY: API key for OpenRouter LLM access.
         TAVILY_API_KEY: API key for Tavily web search.
         DEFAULT_MODEL: OpenRouter model string to use by default.
         OPENROUTER_BASE_URL: Base URL for OpenRouter's OpenAI-compatible API.
         MAX_SEARCH_RESULTS: How many web results to fetch per query.
+        SOURCE_CONTENT_CHARS: Characters of page content kept per source.
         MAX_TOKENS: Max tokens for each LLM response.
         TEMPERATURE: LLM temperature (0 = deterministic, 1 = creative).
         REQUEST_TIMEOUT: Seconds before an LLM/API call times out.
@@ -68,6 +80,19 @@ class Settings:
         MAX_ITERATIONS: Max reflection loop iterations.
         QUALITY_THRESHOLD: Minimum quality score (0-100) to accept report.
         MAX_SUB_QUERIES: Max sub-queries the decomposer can generate.
+        MAX_CONCURRENT_LLM: Max LLM requests in flight at once per client.
+        MAX_CONCURRENT_SEARCHES: Max Tavily searches in flight at once.
+        SEARCH_CACHE_SIZE: Cached Tavily responses kept in-process (0 = off).
+        SEARCH_CACHE_TTL: Seconds a cached Tavily response stays valid.
+        CATEGORIZE_BATCH_SIZE: Sources per concurrent categorization LLM call.
+        CATEGORIZE_LLM_MIN_UNKNOWN: Share of rule-unplaced sources needed to call the LLM.
+        ANALYSIS_SHARD_SIZE: Sources per concurrent analysis LLM call.
+        FACTCHECK_BATCH_SIZE: Findings per concurrent fact-check LLM call.
+        LLM_RESULT_CACHE_SIZE: Memoized LLM JSON responses kept in-process (0 = off).
+        LLM_RESULT_CACHE_TTL: Seconds a memoized LLM response stays valid.
+        FACTCHECK_RULE_VERIFY: Verify well-corroborated findings without the LLM.
+        MAX_SOURCES_FOR_ANALYSIS: Top-ranked sources analyzed per iteration (0 = all).
+        MAX_RESEARCH_HISTORY: Past research runs kept in the session sidebar.
     """
 
     # ── API Keys (loaded from .env) ──────────────────────────
@@ -91,11 +116,27 @@ class Settings:
 
     # ── Search Settings ──────────────────────────────────────
     MAX_SEARCH_RESULTS: int = 6
+    SOURCE_CONTENT_CHARS: int = 1500 # Longest excerpt any agent reads
+    SEARCH_CACHE_SIZE: int = 256     # Cached Tavily responses
+    SEARCH_CACHE_TTL: int = 86400    # Cache lifetime in seconds (24h)
+    CATEGORIZE_BATCH_SIZE: int = 20  # Sources per categorization call
+    CATEGORIZE_LLM_MIN_UNKNOWN: float = 0.2  # Skip LLM below this unknown share
 
     # ── Orchestration Settings ───────────────────────────────
     MAX_ITERATIONS: int = 2          # Max reflection loops
     QUALITY_THRESHOLD: float = 65.0  # Min quality to accept (0-100)
     MAX_SUB_QUERIES: int = 5         # Max decomposed sub-queries
+    MAX_CONCURRENT_LLM: int = 4      # Parallel LLM calls (rate-limit guard)
+    MAX_CONCURRENT_SEARCHES: int = 5 # Parallel Tavily searches
+    ANALYSIS_SHARD_SIZE: int = 10    # Sources per analysis shard
+    FACTCHECK_BATCH_SIZE: int = 15   # Findings per fact-check batch
+    LLM_RESULT_CACHE_SIZE: int = 128 # Memoized LLM JSON responses
+    LLM_RESULT_CACHE_TTL: int = 3600 # Memo lifetime in seconds (1h)
+    FACTCHECK_RULE_VERIFY: bool = True  # Rule-verify multi-authority findings
+    MAX_SOURCES_FOR_ANALYSIS: int = 40  # Cap on sources sent to analysis
+
+    # ── UI Settings ──────────────────────────────────────────
+    MAX_RESEARCH_HISTORY: int = 20   # Oldest runs (and results) dropped beyond this
 
     # ── Debug Settings ───────────────────────────────────────
     DEBUG_LLM: bool = field(
@@ -12,24 +12,30 @@ PIPELINE ARCHITECTURE:
     ┌─────────────────────────────────────────────────────────────────┐
     │                                                                 │
     │  START → decompose → retrieve → analyze → fact_check            │
-    │              ▲                                    │              │
-    │              │                                    ▼              │
-    │              │                            generate_insights      │
-    │              │                                    │              │
-    │              │                                    ▼              │
-    │              └── (quality < threshold) ── build_report → END    │
-    │                   & iteration < max                              │
+    │                          ▲                    │                 │
+    │                          │                    ▼                 │
+    │                   refine_queries      generate_insights         │
+    │                    (report gaps)              │                 │
+    │                          ▲                    ▼                 │
+    │                          └───────────── build_report → END      │
+    │                            (quality < threshold                 │
+    │                             & iteration < max)                  │
     │                                                                 │
     └─────────────────────────────────────────────────────────────────┘
 
 USAGE:
-    from orchestrator.graph import create_research_graph, run_research
+    from orchestrator.graph import run_research, arun_research
     result = run_research("What is the impact of AI on healthcare?")
+    result = await arun_research("What is the impact of AI on healthcare?")
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
 import logging
+from contextvars import ContextVar
+from dataclasses import dataclass, field
 from typing import Optional
 
 from langgraph.graph import StateGraph, END
@@ -47,154 +53,216 @@ from config import settings
 
 logger = logging.getLogger(__name__)
 
+# Live progress previews: items shown per step and characters per item
+PREVIEW_ITEMS = 3
+PREVIEW_CHARS = 120
 
-def create_research_graph(
-    llm: Optional[LLMClient] = None,
-    tracker: Optional[ProgressTracker] = None,
-) -> StateGraph:
+
+def _preview(items: list[str]) -> str:
+    """Format the first few items as a short markdown bullet list."""
+    lines = []
+    for item in items[:PREVIEW_ITEMS]:
+        text = " ".join(str(item).split())
+        if len(text) > PREVIEW_CHARS:
+            text = text[:PREVIEW_CHARS].rstrip() + "…"
+        lines.append(f"- {text}")
+    if len(items) > PREVIEW_ITEMS:
+        lines.append(f"- *…and {len(items) - PREVIEW_ITEMS} more*")
+    return "\n".join(lines)
+
+
+@dataclass(slots=True)
+class PipelineContext:
     """
-    Build and compile the LangGraph research pipeline.
+    Per-run LLM client, progress tracker and agents.
 
-    Args:
-        llm: Shared LLM client instance (for token tracking).
-        tracker: Optional progress tracker for UI updates.
+    The compiled graph is shared by every run, so its nodes look these up
+    in the `_pipeline` context variable instead of closing over them.
+    """
+    llm: LLMClient
+    tracker: Optional[ProgressTracker] = None
+    decomposer: DecomposerAgent = field(init=False)
+    retriever: RetrieverAgent = field(init=False)
+    analyzer: AnalysisAgent = field(init=False)
+    fact_checker: FactCheckerAgent = field(init=False)
+    insight_gen: InsightAgent = field(init=False)
+    reporter: ReportAgent = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Initialize all agents with the shared LLM client
+        self.decomposer = DecomposerAgent(self.llm)
+        self.retriever = RetrieverAgent(self.llm)
+        self.analyzer = AnalysisAgent(self.llm)
+        self.fact_checker = FactCheckerAgent(self.llm)
+        self.insight_gen = InsightAgent(self.llm)
+        self.reporter = ReportAgent(self.llm)
+
+
+_pipeline: ContextVar[PipelineContext] = ContextVar("research_pipeline")
+
+
+@functools.lru_cache(maxsize=1)
+def create_research_graph() -> StateGraph:
+    """
+    Build and compile the LangGraph research pipeline (once per process).
+
+    Nodes read the run's agents and tracker from the `_pipeline` context
+    variable, which arun_research sets around each invocation, so one
+    compiled graph serves every run, including concurrent ones.
 
     Returns:
         Compiled LangGraph StateGraph ready to invoke.
     """
-    llm = llm or LLMClient()
-
-    # Initialize all agents with the shared LLM client
-    decomposer = DecomposerAgent(llm)
-    retriever = RetrieverAgent(llm)
-    analyzer = AnalysisAgent(llm)
-    fact_checker = FactCheckerAgent(llm)
-    insight_gen = InsightAgent(llm)
-    reporter = ReportAgent(llm)
-
     # ── Node Functions ───────────────────────────────────────
-    # Each wraps an agent's run() with progress tracking
+    # Each wraps an agent's arun() with progress tracking. Nodes are
+    # async so the graph runs on one event loop via ainvoke(); LangGraph would
+    # otherwise push sync nodes onto executor threads, where Streamlit's
+    # live progress container is not writable.
 
-    def decompose(state: ResearchState) -> dict:
+    async def decompose(state: ResearchState) -> dict:
         """Node: Decompose query into sub-queries."""
-        llm.set_agent("Decomposer")
-        if tracker:
-            with tracker.agent_step("decomposer"):
-                result = decomposer.run(state)
-                tracker.update_message(
-                    f"Created {len(result.get('sub_queries', []))} sub-queries"
-                )
+        ctx = _pipeline.get()
+        ctx.llm.set_agent("Decomposer")
+        if ctx.tracker:
+            with ctx.tracker.agent_step("decomposer"):
+                result = await ctx.decomposer.arun(state)
+                sub_queries = result.get("sub_queries", [])
+                ctx.tracker.update_message(f"Created {len(sub_queries)} sub-queries")
+                ctx.tracker.set_preview(_preview(sub_queries))
                 return result
-        return decomposer.run(state)
+        return await ctx.decomposer.arun(state)
 
-    def retrieve(state: ResearchState) -> dict:
+    async def retrieve(state: ResearchState) -> dict:
         """Node: Retrieve sources for all sub-queries."""
-        llm.set_agent("Retriever")
-        if tracker:
-            with tracker.agent_step("retriever"):
-                result = retriever.run(state)
+        ctx = _pipeline.get()
+        ctx.llm.set_agent("Retriever")
+        if ctx.tracker:
+            with ctx.tracker.agent_step("retriever"):
+                result = await ctx.retriever.arun(state)
                 n = len(result.get("sources", []))
-                tracker.update_message(f"Collected {n} sources")
-                llm._tavily_calls = getattr(llm, "_tavily_calls", 0) + retriever.tavily_calls
-                retriever.tavily_calls = 0  # Reset for next iteration
+                ctx.tracker.update_message(f"Collected {n} sources")
+                ctx.llm._tavily_calls = getattr(ctx.llm, "_tavily_calls", 0) + ctx.retriever.tavily_calls
+                ctx.retriever.tavily_calls = 0  # Reset for next iteration
                 return result
-        result = retriever.run(state)
-        llm._tavily_calls = getattr(llm, "_tavily_calls", 0) + retriever.tavily_calls
-        retriever.tavily_calls = 0
+        result = await ctx.retriever.arun(state)
+        ctx.llm._tavily_calls = getattr(ctx.llm, "_tavily_calls", 0) + ctx.retriever.tavily_calls
+        ctx.retriever.tavily_calls = 0
         return result
 
-    def analyze(state: ResearchState) -> dict:
+    async def analyze(state: ResearchState) -> dict:
         """Node: Critically analyze collected sources."""
-        llm.set_agent("Analyzer")
-        if tracker:
-            with tracker.agent_step("analyzer"):
-                result = analyzer.run(state)
-                n = len(result.get("analysis", {}).get("findings", []))
-                tracker.update_message(f"Extracted {n} findings")
+        ctx = _pipeline.get()
+        ctx.llm.set_agent("Analyzer")
+        if ctx.tracker:
+            with ctx.tracker.agent_step("analyzer"):
+                result = await ctx.analyzer.arun(state)
+                findings = result.get("analysis", {}).get("findings", [])
+                ctx.tracker.update_message(f"Extracted {len(findings)} findings")
+                ctx.tracker.set_preview(_preview([f.get("claim", "") for f in findings]))
                 return result
-        return analyzer.run(state)
+        return await ctx.analyzer.arun(state)
 
-    def fact_check(state: ResearchState) -> dict:
+    async def fact_check(state: ResearchState) -> dict:
         """Node: Cross-validate findings and assign confidence scores."""
-        llm.set_agent("Fact-Checker")
-        if tracker:
-            with tracker.agent_step("fact_checker"):
-                result = fact_checker.run(state)
+        ctx = _pipeline.get()
+        ctx.llm.set_agent("Fact-Checker")
+        if ctx.tracker:
+            with ctx.tracker.agent_step("fact_checker"):
+                result = await ctx.fact_checker.arun(state)
                 score = result.get("fact_check", {}).get(
                     "overall_reliability_score", 0
                 )
-                tracker.update_message(f"Reliability score: {score}/100")
+                ctx.tracker.update_message(f"Reliability score: {score}/100")
                 return result
-        return fact_checker.run(state)
+        return await ctx.fact_checker.arun(state)
 
-    def generate_insights(state: ResearchState) -> dict:
+    async def generate_insights(state: ResearchState) -> dict:
         """Node: Generate hypotheses and identify trends."""
-        llm.set_agent("Insight")
-        if tracker:
-            with tracker.agent_step("insight"):
-                result = insight_gen.run(state)
-                n = len(result.get("insights", {}).get("hypotheses", []))
-                tracker.update_message(f"Generated {n} hypotheses")
+        ctx = _pipeline.get()
+        ctx.llm.set_agent("Insight")
+        if ctx.tracker:
+            with ctx.tracker.agent_step("insight"):
+                result = await ctx.insight_gen.arun(state)
+                hypotheses = result.get("insights", {}).get("hypotheses", [])
+                ctx.tracker.update_message(f"Generated {len(hypotheses)} hypotheses")
+                ctx.tracker.set_preview(
+                    _preview([h.get("statement", "") for h in hypotheses])
+                )
                 return result
-        return insight_gen.run(state)
+        return await ctx.insight_gen.arun(state)
 
-    def build_report(state: ResearchState) -> dict:
+    async def build_report(state: ResearchState) -> dict:
         """Node: Compile final report and evaluate quality."""
-        llm.set_agent("Reporter")
-        if tracker:
-            with tracker.agent_step("reporter"):
-                result = reporter.run(state)
+        ctx = _pipeline.get()
+        ctx.llm.set_agent("Reporter")
+        if ctx.tracker:
+            with ctx.tracker.agent_step("reporter"):
+                result = await ctx.reporter.arun(state)
+                # The quality gate's verdict, reported here so the gate
+                # itself stays a pure router with no UI step of its own.
                 score = result.get("quality_score", 0)
-                tracker.update_message(f"Quality: {score}/100")
+                threshold = state.get("quality_threshold", settings.QUALITY_THRESHOLD)
+                pass_fail = "PASS" if score >= threshold else "FAIL"
+                ctx.tracker.update_message(
+                    f"Quality: {score}/100 (threshold: {threshold}) — "
+                    f"{pass_fail} | Iteration {state.get('iteration', 0) + 1}"
+                    f"/{state.get('max_iterations', settings.MAX_ITERATIONS)}"
+                )
                 return result
-        return reporter.run(state)
+        return await ctx.reporter.arun(state)
 
     # ── Quality Gate (Conditional Edge Router) ───────────────
 
-    def quality_gate(state: ResearchState) -> str:
+    async def quality_gate(state: ResearchState) -> str:
         """
         Decide whether to accept the report or loop back for refinement.
 
         Returns:
             "accept" — Quality is sufficient or max iterations reached.
-            "refine" — Quality is below threshold, loop back to decomposer.
+            "refine" — Quality is below threshold, loop back for refinement.
         """
         quality = state.get("quality_score", 0)
-        iteration = state.get("iteration", 0)
+        threshold = state.get("quality_threshold", settings.QUALITY_THRESHOLD)
         max_iter = state.get("max_iterations", settings.MAX_ITERATIONS)
-        threshold = settings.QUALITY_THRESHOLD
-
-        if tracker:
-            with tracker.agent_step("quality_gate"):
-                pass_fail = "PASS" if quality >= threshold else "FAIL"
-                tracker.update_message(
-                    f"Quality: {quality}/100 (threshold: {threshold}) — "
-                    f"{pass_fail} | Iteration {iteration + 1}/{max_iter}"
-                )
-
-        if quality >= threshold:
-            logger.info(f"Quality gate PASSED: {quality} >= {threshold}")
-            return "accept"
-
-        if iteration + 1 >= max_iter:
-            logger.warning(
-                f"Quality gate: {quality} < {threshold}, "
-                f"but max iterations ({max_iter}) reached. Accepting."
-            )
-            return "accept"
-
-        logger.info(
-            f"Quality gate FAILED: {quality} < {threshold}. "
-            f"Refining (iteration {iteration + 1}/{max_iter})."
-        )
-        return "refine"
+        last_iteration = state.get("iteration", 0) + 1 >= max_iter
+        return "accept" if quality >= threshold or last_iteration else "refine"
 
     # ── Iteration Counter ────────────────────────────────────
 
-    def increment_iteration(state: ResearchState) -> dict:
+    async def increment_iteration(state: ResearchState) -> dict:
         """Increment the iteration counter before looping back."""
         return {"iteration": state.get("iteration", 0) + 1}
 
+    async def refine_queries(state: ResearchState) -> dict:
+        """
+        Node: Re-target retrieval at the gaps the last report identified.
+
+        The reporter's follow_up_queries become the next sub-queries
+        directly, saving the decomposer's LLM call; only when the report
+        left none does this fall back to a full decomposition.
+        """
+        follow_ups = [
+            q for q in state.get("report", {}).get("follow_up_queries", [])
+            if isinstance(q, str) and q.strip()
+        ][:settings.MAX_SUB_QUERIES]
+        if not follow_ups:
+            return await decompose(state)
+
+        ctx = _pipeline.get()
+        if ctx.tracker:
+            with ctx.tracker.agent_step(
+                "decomposer", "Targeting gaps from the previous report..."
+            ):
+                ctx.tracker.update_message(
+                    f"Reusing {len(follow_ups)} follow-up queries as sub-queries"
+                )
+                ctx.tracker.set_preview(_preview(follow_ups))
+        logger.info(f"Refinement: targeting {len(follow_ups)} report gaps")
+        return {
+            "sub_queries": follow_ups,
+            "status": f"Refining with {len(follow_ups)} follow-up queries",
+        }
+
     # ── Build the Graph ──────────────────────────────────────
 
     builder = StateGraph(ResearchState)
@@ -207,6 +275,7 @@ def create_research_graph(
     builder.add_node("generate_insights", generate_insights)
     builder.add_node("build_report", build_report)
     builder.add_node("increment_iteration", increment_iteration)
+    builder.add_node("refine_queries", refine_queries)
 
     # Set entry point
     builder.set_entry_point("decompose")
@@ -228,8 +297,9 @@ def create_research_graph(
         },
     )
 
-    # Loop back: increment → decompose (for reflection)
-    builder.add_edge("increment_iteration", "decompose")
+    # Loop back: increment → refine_queries → retrieve (for reflection)
+    builder.add_edge("increment_iteration", "refine_queries")
+    builder.add_edge("refine_queries", "retrieve")
 
     # Compile the graph
     graph = builder.compile()
@@ -242,28 +312,59 @@ def run_research(
     llm: Optional[LLMClient] = None,
     tracker: Optional[ProgressTracker] = None,
     max_iterations: int = None,
+    quality_threshold: float = None,
 ) -> dict:
     """
     Execute the full research pipeline for a given query.
 
-    This is the main entry point for running research.
+    This is the main (synchronous) entry point for running research;
+    it drives arun_research on a fresh event loop.
 
     Args:
         query: The research question to investigate.
         llm: Optional shared LLM client.
         tracker: Optional progress tracker for UI updates.
         max_iterations: Override max reflection loop iterations.
+        quality_threshold: Override the minimum quality score to accept.
 
     Returns:
         Final ResearchState dict with all results.
     """
-    llm = llm or LLMClient()
-    graph = create_research_graph(llm=llm, tracker=tracker)
+    return asyncio.run(arun_research(
+        query,
+        llm=llm,
+        tracker=tracker,
+        max_iterations=max_iterations,
+        quality_threshold=quality_threshold,
+    ))
+
+
+async def arun_research(
+    query: str,
+    llm: Optional[LLMClient] = None,
+    tracker: Optional[ProgressTracker] = None,
+    max_iterations: int = None,
+    quality_threshold: float = None,
+) -> dict:
+    """
+    Execute the full research pipeline on the running event loop.
 
-    # Keep a reference to the retriever for Tavily call tracking
-    # (agents are created inside create_research_graph, so we also store
-    #  a reference on the llm object for convenience)
-    from agents.retriever_agent import RetrieverAgent as _RA  # noqa: avoid circular at module level
+    Several queries can run concurrently on one loop, e.g. with
+    asyncio.gather; give each its own LLMClient so token usage stays
+    separate.
+
+    Args:
+        query: The research question to investigate.
+        llm: Optional shared LLM client.
+        tracker: Optional progress tracker for UI updates.
+        max_iterations: Override max reflection loop iterations.
+        quality_threshold: Override the minimum quality score to accept.
+
+    Returns:
+        Final ResearchState dict with all results.
+    """
+    llm = llm or LLMClient()
+    graph = create_research_graph()
 
     initial_state: ResearchState = {
         "original_query": query,
@@ -275,6 +376,11 @@ def run_research(
         "report": {},
         "iteration": 0,
         "max_iterations": max_iterations or settings.MAX_ITERATIONS,
+        "quality_threshold": (
+            float(quality_threshold)
+            if quality_threshold is not None
+            else settings.QUALITY_THRESHOLD
+        ),
         "quality_score": 0.0,
         "status": "Starting research...",
         "errors": [],
@@ -284,8 +390,11 @@ def run_research(
 
     logger.info(f"Starting research pipeline for: {query}")
 
+    # Nodes pick this run's agents and tracker up from the context; tasks
+    # LangGraph spawns for them inherit it from here.
+    token = _pipeline.set(PipelineContext(llm=llm, tracker=tracker))
     try:
-        result = graph.invoke(initial_state)
+        result = await graph.ainvoke(initial_state)
 
         # Attach usage stats from the shared LLM client
         usage = llm.get_usage_summary()
@@ -306,3 +415,5 @@ def run_research(
         initial_state["errors"] = [str(e)]
         initial_state["usage_stats"] = llm.get_usage_summary()
         return initial_state
+    finally:
+        _pipeline.reset(token)
@@ -36,13 +36,20 @@ STATE FLOW:
     │    ▼                                                            │
     │  quality_gate ──→ END (if score >= threshold)                   │
     │       │                                                         │
-    │       └──→ decompose (if score < threshold & iteration < max)   │
+    │       └──→ refine_queries → retrieve (if score < threshold     │
+    │                                        & iteration < max)       │
     └──────────────────────────────────────────────────────────────────┘
 """
 
 from __future__ import annotations
 
-from typing import TypedDict, Any
+import operator
+from typing import Annotated, TypedDict, Any
+
+
+def _merge_dicts(left: dict | None, right: dict | None) -> dict:
+    """Reducer: shallow-merge a node's dict update into the current value."""
+    return {**(left or {}), **(right or {})}
 
 
 class ResearchState(TypedDict, total=False):
@@ -50,7 +57,9 @@ class ResearchState(TypedDict, total=False):
     Shared state passed through the LangGraph research pipeline.
 
     All fields are optional (total=False) so agents only need to
-    return the fields they update.
+    return the fields they update. `errors` and `agent_outputs` have
+    reducers: a node returns only its new entries, which LangGraph
+    appends/merges, instead of copying the whole accumulated value.
     """
 
     # ── Input ────────────────────────────────────────────────
@@ -77,10 +86,11 @@ class ResearchState(TypedDict, total=False):
     # ── Orchestration Metadata ───────────────────────────────
     iteration: int               # Current reflection loop iteration
     max_iterations: int          # Max allowed iterations
+    quality_threshold: float     # Min quality score to accept the report
     quality_score: float         # Report quality score (0-100)
     status: str                  # Pipeline status message
-    errors: list[str]            # Any errors encountered
-    agent_outputs: dict[str, Any]  # Raw outputs for debugging
+    errors: Annotated[list[str], operator.add]  # Any errors encountered
+    agent_outputs: Annotated[dict[str, Any], _merge_dicts]  # Raw outputs for debugging
 
     # ── Usage Tracking ────────────────────────────────────────
     usage_stats: dict            # Token usage & Tavily call stats
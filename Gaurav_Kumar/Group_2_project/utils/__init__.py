@@ -5,6 +5,8 @@ Shared utility modules used across the project.
 
 Contents:
     llm_client.py  — Unified OpenRouter LLM client with retry logic.
+    prompt_template.py — Precompiled prompt templates (parse once, render fast).
+    cache.py       — Thread-safe LRU cache and blake2b digest for LLM results.
     pdf_export.py  — PDF report generation using FPDF2.
     callbacks.py   — Streamlit progress callbacks for agent pipeline.
 """
@@ -0,0 +1,105 @@
+"""
+utils/cache.py
+===============
+Small in-process caches for LLM and search results.
+
+The reflection loop re-runs analysis and fact-checking, often over an
+unchanged source set, and repeated queries in one Streamlit session hit
+the same prompts and sub-queries. Caching parsed LLM output or search
+results keyed by a digest of the exact request makes those repeats free.
+
+USAGE:
+    from utils.cache import LRUCache, digest
+    cache = LRUCache(maxsize=128)
+    key = digest(model, user_prompt)
+    if (hit := cache.get(key)) is None:
+        hit = cache.put(key, call_llm())
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+
+def digest(*parts: str) -> str:
+    """
+    Stable 128-bit blake2b digest of one or more strings.
+
+    Parts are NUL-separated so ("ab", "c") and ("a", "bc") differ.
+
+    Args:
+        *parts: Strings that together identify a cached value.
+
+    Returns:
+        Hex digest string.
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        h.update(part.encode("utf-8"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+class LRUCache:
+    """
+    Thread-safe least-recently-used cache.
+
+    Values are deep-copied on the way in and out, so callers can mutate
+    what they get back without corrupting the cached entry.
+
+    Attributes:
+        maxsize: Maximum number of entries; 0 disables caching.
+        ttl: Seconds an entry stays valid; None means no expiry.
+        hits: Number of successful lookups.
+        misses: Number of failed lookups.
+    """
+
+    def __init__(self, maxsize: int = 128, ttl: Optional[float] = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        # key -> (expiry deadline on the monotonic clock, value)
+        self._data: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return a copy of the cached value, or None on a miss or expiry."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self._data[key]
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            value = entry[1]
+        return copy.deepcopy(value)
+
+    def put(self, key: str, value: Any) -> Any:
+        """Store a copy of `value` under `key` and return `value`."""
+        if self.maxsize <= 0:
+            return value
+        stored = copy.deepcopy(value)
+        expires = time.monotonic() + self.ttl if self.ttl is not None else float("inf")
+        with self._lock:
+            self._data[key] = (expires, stored)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+        return value
+
+    def clear(self) -> None:
+        """Drop every entry and reset the hit/miss counters."""
+        with self._lock:
+            self._data.clear()
+            self.hits = self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -11,6 +11,7 @@ USAGE:
     with tracker.agent_step("retriever"):
         # ... do work ...
         tracker.update_message("Found 6 sources")
+        tracker.set_preview("- sub-query one\n- sub-query two")
 """
 
 from __future__ import annotations
@@ -56,11 +57,6 @@ AGENT_CONFIG = {
         "icon": "📝",
         "description": "Compiling the final research report...",
     },
-    "quality_gate": {
-        "name": "Quality Gate",
-        "icon": "🎯",
-        "description": "Evaluating research quality...",
-    },
 }
 
 
@@ -129,9 +125,11 @@ class ProgressTracker:
         self.current_step = step
         self.steps.append(step)
 
-        # Live UI: show the agent starting
+        # Live UI: show the agent starting in a placeholder that the
+        # completion line later replaces, so each step is one element.
+        slot = self._live_slot()
         self._live_write(
-            f"⏳ **{config['icon']} {config['name']}** — {step.message}"
+            f"⏳ **{config['icon']} {config['name']}** — {step.message}", slot
         )
         self._notify()
 
@@ -140,11 +138,14 @@ class ProgressTracker:
             yield step
             step.status = "complete"
             step.duration_seconds = time.time() - step_start
-            # Live UI: show completion
-            self._live_write(
+            # Live UI: show completion, with the step's output preview
+            # (if any) in the same placeholder.
+            line = (
                 f"✅ **{config['icon']} {config['name']}** — "
                 f"{step.message} ({step.duration_seconds:.1f}s)"
             )
+            preview = step.details.get("preview")
+            self._live_write(f"{line}\n\n{preview}" if preview else line, slot)
             logger.info(
                 f"{config['icon']} {config['name']} completed "
                 f"in {step.duration_seconds:.1f}s"
@@ -155,7 +156,8 @@ class ProgressTracker:
             step.duration_seconds = time.time() - step_start
             self._live_write(
                 f"❌ **{config['icon']} {config['name']}** — "
-                f"{step.message} ({step.duration_seconds:.1f}s)"
+                f"{step.message} ({step.duration_seconds:.1f}s)",
+                slot,
             )
             logger.error(f"{config['icon']} {config['name']} failed: {e}")
             raise
@@ -169,17 +171,43 @@ class ProgressTracker:
             self.current_step.message = message
             self._notify()
 
+    def set_preview(self, markdown: str):
+        """
+        Attach a short markdown preview of the current step's output.
+
+        It is rendered under the step's completion line, in the same
+        placeholder, so partial results show up as the pipeline runs.
+        """
+        if self.current_step:
+            self.current_step.details["preview"] = markdown
+
     def total_duration(self) -> float:
         """Total elapsed time since tracker was created."""
         return time.time() - self.start_time
 
-    def _live_write(self, text: str):
-        """Write a line to the live Streamlit container if available."""
+    def _live_slot(self) -> Any:
+        """Reserve a single-element placeholder in the live container."""
         if self._live:
             try:
-                self._live.write(text)
+                return self._live.empty()
             except Exception:
                 pass
+        return None
+
+    def _live_write(self, text: str, slot: Any = None):
+        """
+        Write a line to the live Streamlit container if available.
+
+        With a `slot` from _live_slot(), the text replaces that
+        placeholder's content instead of appending a new element.
+        """
+        try:
+            if slot is not None:
+                slot.markdown(text)
+            elif self._live:
+                self._live.write(text)
+        except Exception:
+            pass
 
     def _notify(self):
         """Call the update callback if registered."""
@@ -5,8 +5,13 @@ Unified LLM client wrapping OpenRouter's OpenAI-compatible API.
 
 Features:
     - Automatic retry with exponential backoff (3 attempts)
+    - Async wrapper with a concurrency cap for parallel agent calls
     - Robust JSON parsing from LLM responses
-    - Token usage tracking
+    - Token usage tracking (including provider prompt-cache hits)
+    - One shared HTTP connection pool per API key across clients
+    - In-process memoization of parsed JSON responses by prompt digest
+      (deterministic or explicitly opted-in calls only)
+    - Prompt-cache breakpoint on the static system prompt
     - Debug logging support
 
 USAGE:
@@ -14,15 +19,19 @@ USAGE:
     client = LLMClient()
     response = client.chat("You are helpful.", "What is AI?")
     data = client.chat_json("Return JSON.", "List 3 fruits.")
+    data = await client.achat_json("Return JSON.", "List 3 fruits.")
 """
 
 from __future__ import annotations
 
-import json
 import re
+import asyncio
+import functools
 import logging
+import threading
 from typing import Optional
 
+import orjson
 from openai import OpenAI
 from tenacity import (
     retry,
@@ -33,9 +42,43 @@ from tenacity import (
 )
 
 from config import settings
+from utils.cache import LRUCache, digest
 
 logger = logging.getLogger(__name__)
 
+# Providers that need an explicit cache_control breakpoint to reuse a prompt
+# prefix. OpenAI-style providers cache prefixes automatically, so they only
+# need the system prompt to stay byte-identical between calls.
+CACHE_CONTROL_PROVIDERS: tuple[str, ...] = ("anthropic/", "google/")
+
+# Parsed chat_json responses keyed by a digest of (model, sampling params,
+# system prompt, user prompt). Shared by all clients in the process, so the
+# reflection loop and repeated queries reuse identical calls. Only calls at
+# temperature 0, or that opt in with cache=True, are stored: a sampled
+# call is expected to give a fresh answer when re-run. Analysis shards,
+# fact-check batches and the report opt in, since the reflection loop
+# often re-sends them unchanged.
+_response_cache = LRUCache(settings.LLM_RESULT_CACHE_SIZE, ttl=settings.LLM_RESULT_CACHE_TTL)
+
+
+@functools.lru_cache(maxsize=4)
+def _shared_openai_client(api_key: str, base_url: str) -> OpenAI:
+    """
+    Return a process-wide OpenAI client for this key and endpoint.
+
+    The SDK client owns an httpx connection pool and is thread-safe, so
+    every LLMClient reuses it instead of opening new TLS connections for
+    each research run.
+
+    Args:
+        api_key: OpenRouter API key.
+        base_url: OpenAI-compatible API base URL.
+
+    Returns:
+        A shared OpenAI client.
+    """
+    return OpenAI(api_key=api_key, base_url=base_url)
+
 
 class LLMClient:
     """
@@ -45,17 +88,20 @@ class LLMClient:
         model: The default model to use for requests.
         total_tokens: Running total of tokens consumed.
         call_log: Per-call token usage records for detailed breakdown.
+        cache_hits: chat_json calls answered from the response cache.
     """
 
     def __init__(self, model: Optional[str] = None):
-        self.client = OpenAI(
-            api_key=settings.OPENROUTER_API_KEY,
-            base_url=settings.OPENROUTER_BASE_URL,
+        self.client = _shared_openai_client(
+            settings.OPENROUTER_API_KEY, settings.OPENROUTER_BASE_URL
         )
         self.model = model or settings.DEFAULT_MODEL
         self.total_tokens: int = 0
-        self.call_log: list[dict] = []  # [{agent, prompt_tokens, completion_tokens, total_tokens}]
+        self.call_log: list[dict] = []  # [{agent, prompt_tokens, cached_tokens, completion_tokens, total_tokens}]
+        self.cache_hits: int = 0
         self._current_agent: str = "unknown"  # Set by graph nodes before LLM calls
+        self._slots = threading.BoundedSemaphore(settings.MAX_CONCURRENT_LLM)
+        self._usage_lock = threading.Lock()
 
     def set_agent(self, agent_name: str):
         """Set the current agent label for token attribution."""
@@ -98,7 +144,7 @@ class LLMClient:
         response = self.client.chat.completions.create(
             model=model,
             messages=[
-                {"role": "system", "content": system_prompt},
+                self._system_message(system_prompt, model),
                 {"role": "user", "content": user_prompt},
             ],
             temperature=temperature,
@@ -111,16 +157,20 @@ class LLMClient:
             prompt_tok = response.usage.prompt_tokens or 0
             completion_tok = response.usage.completion_tokens or 0
             total_tok = response.usage.total_tokens or (prompt_tok + completion_tok)
-            self.total_tokens += total_tok
-            self.call_log.append({
-                "agent": self._current_agent,
-                "prompt_tokens": prompt_tok,
-                "completion_tokens": completion_tok,
-                "total_tokens": total_tok,
-            })
+            details = getattr(response.usage, "prompt_tokens_details", None)
+            cached_tok = (getattr(details, "cached_tokens", 0) or 0) if details else 0
+            with self._usage_lock:
+                self.total_tokens += total_tok
+                self.call_log.append({
+                    "agent": self._current_agent,
+                    "prompt_tokens": prompt_tok,
+                    "cached_tokens": cached_tok,
+                    "completion_tokens": completion_tok,
+                    "total_tokens": total_tok,
+                })
             logger.info(
                 f"Tokens [{self._current_agent}]: {total_tok} "
-                f"(prompt={prompt_tok}, "
+                f"(prompt={prompt_tok}, cached={cached_tok}, "
                 f"completion={completion_tok}) | "
                 f"Running total: {self.total_tokens}"
             )
@@ -134,6 +184,7 @@ class LLMClient:
         self,
         system_prompt: str,
         user_prompt: str,
+        cache: Optional[bool] = None,
         **kwargs,
     ) -> dict:
         """
@@ -142,6 +193,8 @@ class LLMClient:
         Args:
             system_prompt: System message (will be enhanced with JSON instruction).
             user_prompt: User message.
+            cache: Memoize the parsed response. None (default) caches only
+                when the effective temperature is 0.
             **kwargs: Passed to self.chat().
 
         Returns:
@@ -150,13 +203,85 @@ class LLMClient:
         Raises:
             ValueError: If JSON cannot be extracted from the response.
         """
-        enhanced_system = (
-            system_prompt
-            + "\n\nCRITICAL: You MUST respond with valid JSON only. "
-            "No markdown code fences, no explanatory text outside the JSON."
+        key = self._cache_key(system_prompt, user_prompt, cache, kwargs)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+        return self._chat_json_fresh(key, system_prompt, user_prompt, **kwargs)
+
+    async def achat_json(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        cache: Optional[bool] = None,
+        **kwargs,
+    ) -> dict:
+        """
+        Async counterpart of chat_json().
+
+        The blocking request runs in a worker thread so several agent calls
+        can be awaited together. At most settings.MAX_CONCURRENT_LLM requests
+        per client are in flight at once, to stay within provider rate limits.
+
+        Args:
+            system_prompt: System message (will be enhanced with JSON instruction).
+            user_prompt: User message.
+            cache: Memoize the parsed response (see chat_json).
+            **kwargs: Passed to self.chat().
+
+        Returns:
+            Parsed JSON as a Python dict.
+        """
+        # Cache hits return without a worker thread or a concurrency slot
+        key = self._cache_key(system_prompt, user_prompt, cache, kwargs)
+        cached = self._cache_lookup(key)
+        if cached is not None:
+            return cached
+
+        def _call() -> dict:
+            with self._slots:
+                return self._chat_json_fresh(key, system_prompt, user_prompt, **kwargs)
+
+        return await asyncio.to_thread(_call)
+
+    def _chat_json_fresh(
+        self, key: Optional[str], system_prompt: str, user_prompt: str, **kwargs,
+    ) -> dict:
+        """Make the chat_json request and memoize the parsed result if keyed."""
+        raw = self.chat(self._json_system_prompt(system_prompt), user_prompt, **kwargs)
+        result = self._parse_json(raw)
+        return _response_cache.put(key, result) if key is not None else result
+
+    def _cache_key(
+        self, system_prompt: str, user_prompt: str, cache: Optional[bool], kwargs: dict,
+    ) -> Optional[str]:
+        """
+        Digest of everything that determines a chat_json response, or None
+        if the call is not cached (sampled and not opted in).
+        """
+        temperature = kwargs.get("temperature")
+        if temperature is None:
+            temperature = settings.TEMPERATURE
+        if not (cache if cache is not None else temperature == 0):
+            return None
+        return digest(
+            kwargs.get("model") or self.model,
+            repr(temperature),
+            repr(kwargs.get("max_tokens")),
+            system_prompt,
+            user_prompt,
         )
-        raw = self.chat(enhanced_system, user_prompt, **kwargs)
-        return self._parse_json(raw)
+
+    def _cache_lookup(self, key: Optional[str]) -> Optional[dict]:
+        """Return a cached response (counting the hit), or None."""
+        if key is None:
+            return None
+        cached = _response_cache.get(key)
+        if cached is not None:
+            with self._usage_lock:
+                self.cache_hits += 1
+            logger.info(f"LLM cache hit [{self._current_agent}]; skipping request")
+        return cached
 
     def get_usage_summary(self) -> dict:
         """
@@ -169,17 +294,56 @@ class LLMClient:
         for entry in self.call_log:
             agent = entry["agent"]
             if agent not in by_agent:
-                by_agent[agent] = {"prompt_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "calls": 0}
+                by_agent[agent] = {"prompt_tokens": 0, "cached_tokens": 0, "completion_tokens": 0, "total_tokens": 0, "calls": 0}
             by_agent[agent]["prompt_tokens"] += entry["prompt_tokens"]
+            by_agent[agent]["cached_tokens"] += entry["cached_tokens"]
             by_agent[agent]["completion_tokens"] += entry["completion_tokens"]
             by_agent[agent]["total_tokens"] += entry["total_tokens"]
             by_agent[agent]["calls"] += 1
         return {
             "by_agent": by_agent,
             "total_tokens": self.total_tokens,
+            "cached_tokens": sum(a["cached_tokens"] for a in by_agent.values()),
             "total_calls": len(self.call_log),
+            "cache_hits": self.cache_hits,
         }
 
+    @staticmethod
+    @functools.lru_cache(maxsize=32)
+    def _json_system_prompt(system_prompt: str) -> str:
+        """
+        Append the JSON-only instruction to a system prompt.
+
+        Memoized per agent prompt so every call sends the very same string,
+        which keeps the cacheable prefix stable for the provider.
+        """
+        return (
+            system_prompt
+            + "\n\nCRITICAL: You MUST respond with valid JSON only. "
+            "No markdown code fences, no explanatory text outside the JSON."
+        )
+
+    @staticmethod
+    def _system_message(system_prompt: str, model: str) -> dict:
+        """
+        Build the system message, marking it cacheable where the provider
+        needs an explicit breakpoint.
+
+        Every agent's system prompt is a module-level constant, so it is an
+        identical prefix on each call and across reflection iterations; only
+        the user message changes.
+        """
+        if model.startswith(CACHE_CONTROL_PROVIDERS):
+            return {
+                "role": "system",
+                "content": [{
+                    "type": "text",
+                    "text": system_prompt,
+                    "cache_control": {"type": "ephemeral"},
+                }],
+            }
+        return {"role": "system", "content": system_prompt}
+
     @staticmethod
     def _parse_json(text: str) -> dict:
         """
@@ -204,34 +368,34 @@ class LLMClient:
 
         # 1. Try direct parse
         try:
-            result = json.loads(text)
+            result = orjson.loads(text)
             return result if isinstance(result, dict) else {"items": result}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         # 2. Remove markdown code fences
         cleaned = re.sub(r"```(?:json)?\s*\n?", "", text).strip()
         try:
-            result = json.loads(cleaned)
+            result = orjson.loads(cleaned)
             return result if isinstance(result, dict) else {"items": result}
-        except json.JSONDecodeError:
+        except orjson.JSONDecodeError:
             pass
 
         # 3. Extract JSON object with regex
         match = re.search(r"\{.*\}", cleaned, re.DOTALL)
         if match:
             try:
-                return json.loads(match.group())
-            except json.JSONDecodeError:
+                return orjson.loads(match.group())
+            except orjson.JSONDecodeError:
                 pass
 
         # 4. Extract JSON array with regex
         match = re.search(r"\[.*\]", cleaned, re.DOTALL)
         if match:
             try:
-                items = json.loads(match.group())
+                items = orjson.loads(match.group())
                 return {"items": items}
-            except json.JSONDecodeError:
+            except orjson.JSONDecodeError:
                 pass
 
         raise ValueError(
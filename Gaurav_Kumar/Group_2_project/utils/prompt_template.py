@@ -0,0 +1,63 @@
+"""
+utils/prompt_template.py
+=========================
+Precompiled prompt templates.
+
+`str.format` re-parses its template on every call. The agent prompts are
+fixed at import time, so each agent parses its USER_PROMPT_TEMPLATE once
+and renders it by filling the precomputed slots and joining them.
+
+USAGE:
+    from utils.prompt_template import compile_template
+    render = compile_template("Query: {query}\\nSources:\\n{sources_text}")
+    prompt = render(query="AI safety", sources_text="...")
+"""
+
+from __future__ import annotations
+
+from string import Formatter
+from typing import Any, Callable
+
+
+def compile_template(template: str) -> Callable[..., str]:
+    """
+    Parse a `str.format` template once and return a fast render callable.
+
+    Only plain named fields are supported (with optional conversion and
+    format spec), which covers every template in `prompts/`. Rendering
+    produces the same string as `template.format(**fields)`.
+
+    Args:
+        template: A format string with {named} placeholders.
+
+    Returns:
+        A function taking the placeholder values as keyword arguments.
+
+    Raises:
+        ValueError: If the template uses positional or nested fields.
+    """
+    formatter = Formatter()
+    pieces: list[str] = []
+    # (slot index in pieces, field name, conversion, format spec)
+    slots: list[tuple[int, str, str | None, str]] = []
+
+    for literal, name, spec, conversion in formatter.parse(template):
+        if literal:
+            pieces.append(literal)
+        if name is None:
+            continue
+        if not name.isidentifier() or "{" in spec:
+            raise ValueError(f"Unsupported template field: {{{name}}}")
+        slots.append((len(pieces), name, conversion, spec))
+        pieces.append("")
+
+    def render(**fields: Any) -> str:
+        out = pieces.copy()
+        for index, name, conversion, spec in slots:
+            value = fields[name]
+            if conversion:
+                value = formatter.convert_field(value, conversion)
+            out[index] = value if value.__class__ is str and not spec else format(value, spec)
+        return "".join(out)
+
+    return render